@@ -0,0 +1,27 @@
+"""add_conflict_dedup_indexes
+
+Revision ID: 5b7e2d9a41c3
+Revises: 138c27fb806b
+Create Date: 2025-11-15 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5b7e2d9a41c3'
+down_revision = '138c27fb806b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite indexes for the pending-conflict deduplication queries run during each sync
+    op.create_index('idx_conflicts_ticket_status', 'conflicts', ['ticket_number', 'resolution_status'])
+    op.create_index('idx_conflicts_created_status', 'conflicts', ['zammad_created_at', 'resolution_status'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_conflicts_created_status', table_name='conflicts')
+    op.drop_index('idx_conflicts_ticket_status', table_name='conflicts')
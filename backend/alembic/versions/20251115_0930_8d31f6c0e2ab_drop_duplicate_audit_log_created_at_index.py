@@ -0,0 +1,25 @@
+"""drop_duplicate_audit_log_created_at_index
+
+Revision ID: 8d31f6c0e2ab
+Revises: 5b7e2d9a41c3
+Create Date: 2025-11-15 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d31f6c0e2ab'
+down_revision = '5b7e2d9a41c3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # idx_audit_logs_created_at_desc already covers created_at in both scan directions
+    op.drop_index('ix_audit_logs_created_at', table_name='audit_logs')
+
+
+def downgrade() -> None:
+    op.create_index('ix_audit_logs_created_at', 'audit_logs', ['created_at'], unique=False)
@@ -0,0 +1,33 @@
+"""add_pending_conflicts_partial_index
+
+Revision ID: e4a9c7b2d815
+Revises: 8d31f6c0e2ab
+Create Date: 2025-11-15 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a9c7b2d815'
+down_revision = '8d31f6c0e2ab'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial index over pending conflicts only, for the reconcile queue listing and counts
+    op.create_index(
+        'idx_conflicts_pending_type',
+        'conflicts',
+        ['conflict_type'],
+        postgresql_where=sa.text("resolution_status = 'pending'")
+    )
+    # Duplicate of ix_conflicts_resolution_status (index=True on the column)
+    op.drop_index('idx_conflicts_resolution_status', table_name='conflicts')
+
+
+def downgrade() -> None:
+    op.create_index('idx_conflicts_resolution_status', 'conflicts', ['resolution_status'], unique=False)
+    op.drop_index('idx_conflicts_pending_type', table_name='conflicts')
@@ -0,0 +1,34 @@
+"""add_synced_time_entries_partial_index
+
+Revision ID: a6f0d3e8b4c7
+Revises: e4a9c7b2d815
+Create Date: 2025-11-15 10:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6f0d3e8b4c7'
+down_revision = 'e4a9c7b2d815'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial covering index for the dashboard's synced-minutes-per-day query
+    op.create_index(
+        'idx_time_entries_synced_date',
+        'time_entries',
+        ['entry_date'],
+        postgresql_include=['time_minutes'],
+        postgresql_where=sa.text("sync_status = 'synced'")
+    )
+    # Duplicate of ix_time_entries_sync_status (index=True on the column)
+    op.drop_index('idx_time_entries_sync_status', table_name='time_entries')
+
+
+def downgrade() -> None:
+    op.create_index('idx_time_entries_sync_status', 'time_entries', ['sync_status'], unique=False)
+    op.drop_index('idx_time_entries_synced_date', table_name='time_entries')
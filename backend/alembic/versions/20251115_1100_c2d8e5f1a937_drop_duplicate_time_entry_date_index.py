@@ -0,0 +1,25 @@
+"""drop_duplicate_time_entry_date_index
+
+Revision ID: c2d8e5f1a937
+Revises: a6f0d3e8b4c7
+Create Date: 2025-11-15 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2d8e5f1a937'
+down_revision = 'a6f0d3e8b4c7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Duplicate of ix_time_entries_entry_date (index=True on the column)
+    op.drop_index('idx_time_entries_entry_date', table_name='time_entries')
+
+
+def downgrade() -> None:
+    op.create_index('idx_time_entries_entry_date', 'time_entries', ['entry_date'], unique=False)
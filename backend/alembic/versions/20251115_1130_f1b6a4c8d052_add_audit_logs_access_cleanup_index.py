@@ -0,0 +1,33 @@
+"""add_audit_logs_access_cleanup_index
+
+Revision ID: f1b6a4c8d052
+Revises: c2d8e5f1a937
+Create Date: 2025-11-15 11:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1b6a4c8d052'
+down_revision = 'c2d8e5f1a937'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partial index matching the access-log retention predicate, so cleanup is a range scan
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_audit_logs_access_created',
+            'audit_logs',
+            ['created_at'],
+            postgresql_where=sa.text("action NOT LIKE 'sync%'"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_audit_logs_access_created', table_name='audit_logs', postgresql_concurrently=True)
@@ -57,13 +57,9 @@ async def read_audit_logs(
     if user:
         query = query.filter(AuditLog.user == user)
     
-    # Get all logs for total (efficient for small datasets)
-    all_logs = query.all()
-    total = len(all_logs)
-    print(f"DEBUG: action_type={action_type}, total={total}, skip={skip}, limit={limit}")  # Temporary debug
-    
-    # Apply pagination
-    logs = all_logs[skip:skip + limit]
+    # Count in SQL and load only the requested page, so only that page is validated into the response
+    total = query.order_by(None).count()
+    logs = query.offset(skip).limit(limit).all()
     return PaginatedAuditLogs(data=logs, total=total)
 
 @router.get("/{log_id}", response_model=AuditLogInDB)
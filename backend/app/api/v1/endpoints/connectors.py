@@ -223,8 +223,8 @@ async def test_connector_connection(
             db_connector.api_token = encrypt_data(request.api_token)
         
         try:
-            connector_instance = await get_connector_instance(db_connector)
-            is_valid = await connector_instance.validate_connection()
+            async with await get_connector_instance(db_connector) as connector_instance:
+                is_valid = await connector_instance.validate_connection()
             if is_valid:
                 return ConnectorValidationResult(valid=True, message="Connection successful!")
             else:
@@ -254,8 +254,8 @@ async def test_connector_connection(
         )
         
         try:
-            connector_instance = await get_connector_instance(temp_connector)
-            is_valid = await connector_instance.validate_connection()
+            async with await get_connector_instance(temp_connector) as connector_instance:
+                is_valid = await connector_instance.validate_connection()
             if is_valid:
                 return ConnectorValidationResult(valid=True, message="Connection successful!")
             else:
@@ -278,8 +278,8 @@ async def validate_connector_config(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Connector not found")
     
     try:
-        connector_instance = await get_connector_instance(db_connector)
-        is_valid = await connector_instance.validate_connection()
+        async with await get_connector_instance(db_connector) as connector_instance:
+            is_valid = await connector_instance.validate_connection()
         if is_valid:
             return ConnectorValidationResult(valid=True, message="Connection successful!")
         else:
@@ -301,8 +301,8 @@ async def get_connector_activities(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Connector not found")
     
     try:
-        connector_instance = await get_connector_instance(db_connector)
-        activities_data = await connector_instance.fetch_activities()
+        async with await get_connector_instance(db_connector) as connector_instance:
+            activities_data = await connector_instance.fetch_activities()
         return [Activity(**activity) for activity in activities_data]
     except ValueError as e:
         # Specific errors from connector (e.g., invalid token, permissions)
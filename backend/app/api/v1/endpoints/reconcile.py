@@ -2,7 +2,6 @@ from typing import Annotated, Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 import logging
 
 from app.database import get_db
@@ -24,6 +23,7 @@ from app.connectors.base import TimeEntryNormalized
 from app.models.connector import Connector as DBConnector
 from app.utils.encrypt import decrypt_data
 from app.utils.audit_logger import create_audit_log
+from app.utils.timezone import BRUSSELS_TZ
 
 router = APIRouter()
 log = logging.getLogger(__name__)
@@ -285,7 +285,7 @@ async def perform_row_action(
         # Mark as resolved, keep Kimai data as-is
         conflict.resolution_status = 'resolved'
         conflict.resolution_action = 'keep_target'
-        conflict.resolved_at = datetime.now(ZoneInfo('Europe/Brussels'))
+        conflict.resolved_at = datetime.now(BRUSSELS_TZ)
         conflict.resolved_by = current_user.username if current_user else 'system'
         conflict.notes = 'User chose to keep target (Kimai) data'
         
@@ -331,7 +331,7 @@ async def perform_row_action(
             
             conflict.resolution_status = 'resolved'
             conflict.resolution_action = 'update_from_source'
-            conflict.resolved_at = datetime.now(ZoneInfo('Europe/Brussels'))
+            conflict.resolved_at = datetime.now(BRUSSELS_TZ)
             conflict.resolved_by = current_user.username if current_user else 'system'
             conflict.notes = f'Updated Kimai timesheet {conflict.kimai_id} from Zammad data'
             
@@ -452,7 +452,7 @@ Zammad URL: {zammad_url}
             # Update conflict and related TimeEntry
             conflict.resolution_status = 'resolved'
             conflict.resolution_action = 'create_in_target'
-            conflict.resolved_at = datetime.now(ZoneInfo('Europe/Brussels'))
+            conflict.resolved_at = datetime.now(BRUSSELS_TZ)
             conflict.resolved_by = current_user.username if current_user else 'system'
             conflict.kimai_id = timesheet['id']
             conflict.notes = f'Created Kimai timesheet {timesheet["id"]} (customer: {customer["id"]}, project: {project["id"]})'
@@ -462,9 +462,9 @@ Zammad URL: {zammad_url}
                 time_entry = db.query(TimeEntry).get(conflict.time_entry_id)
                 if time_entry:
                     time_entry.kimai_id = timesheet['id']
-                    time_entry.synced_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                    time_entry.synced_at = datetime.now(BRUSSELS_TZ)
                     time_entry.sync_status = 'synced'
-                    time_entry.updated_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                    time_entry.updated_at = datetime.now(BRUSSELS_TZ)
             
             log.info(f"Created Kimai timesheet {timesheet['id']} for conflict {conflict.id}")
             
@@ -476,7 +476,7 @@ Zammad URL: {zammad_url}
         # Mark as resolved but skip action
         conflict.resolution_status = 'resolved'
         conflict.resolution_action = 'skipped'
-        conflict.resolved_at = datetime.now(ZoneInfo('Europe/Brussels'))
+        conflict.resolved_at = datetime.now(BRUSSELS_TZ)
         conflict.resolved_by = current_user.username if current_user else 'system'
         conflict.notes = 'User chose to skip this entry'
     
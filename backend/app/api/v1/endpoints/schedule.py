@@ -20,13 +20,27 @@ log = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# (cron, timezone, count) -> (first upcoming run, formatted runs); valid until that first run passes
+_next_runs_cache: dict[tuple[str, str, int], tuple[datetime, list[str]]] = {}
+
+
 def compute_next_runs(cron: str, timezone: str, count: int = 3) -> list[str]:
     """Compute next N run times from cron expression."""
     try:
         tz = ZoneInfo(timezone)
         now = datetime.now(tz)
+        key = (cron, timezone, count)
+        cached = _next_runs_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return list(cached[1])
         iter_obj = croniter(cron, now)
-        return [iter_obj.get_next(datetime).isoformat() for _ in range(count)]
+        run_times = [iter_obj.get_next(datetime) for _ in range(count)]
+        next_runs = [run.isoformat() for run in run_times]
+        if run_times:
+            if len(_next_runs_cache) >= 64:
+                _next_runs_cache.clear()
+            _next_runs_cache[key] = (run_times[0], next_runs)
+        return list(next_runs)
     except Exception as e:
         log.warning(f"Failed to compute next runs: {e}")
         return []
@@ -1,13 +1,12 @@
 from typing import Annotated, Optional
 from datetime import date, timedelta, datetime
-from zoneinfo import ZoneInfo
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.services.sync_service import SyncService
-from app.connectors.zammad_connector import ZammadConnector
+from app.connectors.zammad_connector import ZammadConnector, get_shared_client
 from app.connectors.kimai_connector import KimaiConnector
 from app.services.normalizer import NormalizerService
 from app.services.reconciler import ReconciliationService
@@ -19,9 +18,9 @@ from app.auth import get_current_active_user
 from app.utils.encrypt import decrypt_data
 from app.models.conflict import Conflict
 from app.utils.audit_logger import create_audit_log
+from app.utils.timezone import BRUSSELS_TZ
 from sqlalchemy import func, or_
 from datetime import timedelta
-from zoneinfo import ZoneInfo
 from fastapi.responses import Response
 import csv
 from io import StringIO
@@ -29,6 +28,7 @@ from io import StringIO
 log = logging.getLogger(__name__)
 router = APIRouter()
 
+
 @router.post("/run", response_model=SyncResponse)
 async def run_sync(
     http_request: Request,
@@ -50,15 +50,19 @@ async def run_sync(
         details={"start_date": start_d, "end_date": end_d, "trigger_type": "manual"}
     )
     
-    # Fetch active connectors once
-    zammad_conn = db.query(DBConnector).filter(DBConnector.type == "zammad", DBConnector.is_active == True).first()
-    kimai_conn = db.query(DBConnector).filter(DBConnector.type == "kimai", DBConnector.is_active == True).first()
+    # Fetch active connectors once in one query (descending id, so the oldest active one per type wins)
+    active_conns = db.query(DBConnector).filter(
+        DBConnector.type.in_(("zammad", "kimai")), DBConnector.is_active == True
+    ).order_by(DBConnector.id.desc()).all()
+    conns_by_type = {conn.type: conn for conn in active_conns}
+    zammad_conn = conns_by_type.get("zammad")
+    kimai_conn = conns_by_type.get("kimai")
     
     if not zammad_conn or not kimai_conn:
         # Create SyncRun for no connectors case
         sync_run = SyncRun(
             trigger_type='manual',
-            start_time=datetime.now(ZoneInfo('Europe/Brussels')),
+            start_time=datetime.now(BRUSSELS_TZ),
             status='failed',
             error_message="No active Zammad and Kimai connectors configured",
             entries_synced=0,
@@ -84,7 +88,7 @@ async def run_sync(
     # Create SyncRun for manual sync early
     sync_run = SyncRun(
         trigger_type='manual',
-        start_time=datetime.now(ZoneInfo('Europe/Brussels')),
+        start_time=datetime.now(BRUSSELS_TZ),
         status='running'
     )
     db.add(sync_run)
@@ -100,7 +104,7 @@ async def run_sync(
         "api_token": zammad_token,
         "settings": zammad_conn.settings or {}
     }
-    zammad_instance = ZammadConnector(zammad_config)
+    zammad_instance = ZammadConnector(zammad_config, client=get_shared_client(zammad_config["base_url"], zammad_token))
     
     log.debug("Instantiating Kimai connector")
     kimai_config = {
@@ -122,8 +126,9 @@ async def run_sync(
     )
 
     try:
-        log.info(f"Starting sync process for period {start_d} to {end_d}, run_id: {sync_run_id}")
-        stats = await sync_service.sync_time_entries(start_d, end_d, sync_run, trigger_type='manual')
+        async with zammad_instance, kimai_instance:
+            log.info(f"Starting sync process for period {start_d} to {end_d}, run_id: {sync_run_id}")
+            stats = await sync_service.sync_time_entries(start_d, end_d, sync_run, trigger_type='manual')
         
         log.info(f"Sync completed: processed={stats['processed']}, created={stats['created']}, skipped={stats['skipped']}, conflicts={stats['conflicts']}")
         return SyncResponse(
@@ -235,7 +240,7 @@ async def get_kpi(
 
     # Weekly synced minutes: sum(time_minutes) group by entry_date for last 7 days where sync_status = 'synced'
     from app.models.time_entry import TimeEntry
-    seven_days_ago = datetime.now(ZoneInfo('Europe/Brussels')) - timedelta(days=7)
+    seven_days_ago = datetime.now(BRUSSELS_TZ) - timedelta(days=7)
     weekly_data = db.query(
         func.date(TimeEntry.entry_date).label('day'),
         func.sum(TimeEntry.time_minutes).label('minutes')
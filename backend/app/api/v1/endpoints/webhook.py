@@ -1,5 +1,5 @@
 from typing import Annotated
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Header, Request
 from sqlalchemy.orm import Session
 from hmac import compare_digest
@@ -8,7 +8,7 @@ import base64
 
 from app.database import get_db
 from app.services.sync_service import SyncService
-from app.connectors.zammad_connector import ZammadConnector
+from app.connectors.zammad_connector import ZammadConnector, get_shared_client
 from app.connectors.kimai_connector import KimaiConnector
 from app.services.normalizer import NormalizerService
 from app.services.reconciler import ReconciliationService
@@ -45,9 +45,13 @@ async def zammad_webhook(
     if not ticket_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Missing ticket ID")
     
-    # Fetch active connectors
-    zammad_conn = db.query(DBConnector).filter(DBConnector.type == "zammad", DBConnector.is_active == True).first()
-    kimai_conn = db.query(DBConnector).filter(DBConnector.type == "kimai", DBConnector.is_active == True).first()
+    # Fetch active connectors in one query (descending id, so the oldest active one per type wins)
+    active_conns = db.query(DBConnector).filter(
+        DBConnector.type.in_(("zammad", "kimai")), DBConnector.is_active == True
+    ).order_by(DBConnector.id.desc()).all()
+    conns_by_type = {conn.type: conn for conn in active_conns}
+    zammad_conn = conns_by_type.get("zammad")
+    kimai_conn = conns_by_type.get("kimai")
     if not zammad_conn or not kimai_conn:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Connectors not configured")
     
@@ -56,7 +60,11 @@ async def zammad_webhook(
     kimai_token = decrypt_data(kimai_conn.api_token)
     
     # Instantiate
-    zammad_instance = ZammadConnector({"base_url": str(zammad_conn.base_url), "api_token": zammad_token})
+    zammad_base_url = str(zammad_conn.base_url)
+    zammad_instance = ZammadConnector(
+        {"base_url": zammad_base_url, "api_token": zammad_token},
+        client=get_shared_client(zammad_base_url, zammad_token)
+    )
     kimai_instance = KimaiConnector({"base_url": str(kimai_conn.base_url), "api_token": kimai_token})
     normalizer = NormalizerService()
     reconciler = ReconciliationService()
@@ -70,10 +78,12 @@ async def zammad_webhook(
     )
     
     # Trigger sync for last day to catch recent changes (or enhance for single ticket; V1 uses full range)
-    start_date = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
-    end_date = datetime.now().strftime("%Y-%m-%d")
+    today = date.today()
+    start_date = (today - timedelta(days=1)).isoformat()
+    end_date = today.isoformat()
     try:
-        stats = await sync_service.sync_time_entries(start_date, end_date)
+        async with zammad_instance, kimai_instance:
+            stats = await sync_service.sync_time_entries(start_date, end_date)
         # Log webhook receipt
         audit_log = AuditLog(
             action="webhook_received",
@@ -1,22 +1,61 @@
+import hashlib
+import hmac
+import secrets
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Annotated
+from typing import Dict, Optional, Annotated, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError as JWTError
 from passlib.context import CryptContext
 
 from app import __version__
 from app.config import settings
 from app.schemas.auth import Token, TokenData, User, UserInDB
 
-# Password hashing - use a different scheme to avoid bcrypt 72-byte limit issue
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Password hashing - Argon2id (memory-hard, ~19 MiB per hash); pbkdf2_sha256 is still accepted for existing hashes
+pwd_context = CryptContext(
+    schemes=["argon2", "pbkdf2_sha256"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
 
 ALGORITHM = "HS256"
 
+_JWT_ALGORITHMS = [ALGORITHM]
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Prebuilt 401 payload; a fresh exception is raised each time, since requests run on several threads
+_CREDENTIALS_DETAIL = "Could not validate credentials"
+_CREDENTIALS_HEADERS = {"WWW-Authenticate": "Bearer"}
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=_CREDENTIALS_DETAIL,
+        headers=_CREDENTIALS_HEADERS,
+    )
+
+# Recently verified tokens, keyed by SHA-256 digest (raw tokens are not kept) -> (valid until, username).
+# Entries live at most TOKEN_CACHE_TTL seconds so a changed secret key takes effect quickly
+TOKEN_CACHE_TTL = 5.0
+TOKEN_CACHE_MAX_ENTRIES = 10_000
+_token_cache: Dict[bytes, Tuple[float, str]] = {}
+
+# Recent successful password checks: username -> (HMAC of the credentials, verified at).
+# Repeated logins with the same credentials skip the deliberately slow hash verification. Failures
+# are never cached, and the HMAC key is random per process, so a cache entry can't stand in for a password
+AUTH_CACHE_TTL = 30.0
+AUTH_CACHE_MAX_ENTRIES = 1024
+_AUTH_CACHE_KEY = secrets.token_bytes(32)
+_auth_cache: Dict[str, Tuple[bytes, float]] = {}
+
 def verify_password(plain_password, hashed_password):
     # Truncate password to 72 bytes to avoid bcrypt limitation
     if isinstance(plain_password, str):
@@ -64,31 +103,60 @@ def get_user(username: str):
         return demo_user
     return None
 
+def _credentials_mac(username: str, password: str) -> bytes:
+    return hmac.new(_AUTH_CACHE_KEY, f"{username}\0{password}".encode('utf-8'), hashlib.sha256).digest()
+
 def authenticate_user(username: str, password: str):
     user = get_user(username)
     if not user:
         return False
+    mac = _credentials_mac(username, password)
+    cached = _auth_cache.get(username)
+    if cached is not None and time.monotonic() - cached[1] < AUTH_CACHE_TTL and hmac.compare_digest(cached[0], mac):
+        return user
     if not verify_password(password, user.hashed_password):
         return False
+    _auth_cache.pop(username, None)
+    if len(_auth_cache) >= AUTH_CACHE_MAX_ENTRIES:
+        # Evict the oldest check; tolerate a concurrent login having removed it first
+        for oldest in list(_auth_cache)[:1]:
+            _auth_cache.pop(oldest, None)
+    _auth_cache[username] = (mac, time.monotonic())
     return user
 
+def _cache_token(key: bytes, username: str, exp: Optional[float]) -> None:
+    """Remembers a verified token until the cache TTL or its own expiry, whichever comes first."""
+    now = time.time()
+    ttl = TOKEN_CACHE_TTL if exp is None else min(TOKEN_CACHE_TTL, exp - now)
+    if ttl <= 0:
+        return
+    if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+        # get_current_user runs in the threadpool: prune from a snapshot, tolerating concurrent removals
+        for stale_key, (valid_until, _) in list(_token_cache.items()):
+            if valid_until <= now:
+                _token_cache.pop(stale_key, None)
+        if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+            _token_cache.clear()
+    _token_cache[key] = (now + ttl, username)
+
 def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]):
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = TokenData(username=username)
-    except JWTError:
-        raise credentials_exception
+    cache_key = hashlib.sha256(token.encode()).digest()
+    cached = _token_cache.get(cache_key)
+    if cached is not None and cached[0] > time.time():
+        token_data = TokenData(username=cached[1])
+    else:
+        try:
+            payload = jwt.decode(token, settings.secret_key, algorithms=_JWT_ALGORITHMS)
+            username: str = payload.get("sub")
+            if username is None:
+                raise _credentials_exception()
+            token_data = TokenData(username=username)
+        except JWTError:
+            raise _credentials_exception()
+        _cache_token(cache_key, username, payload.get("exp"))
     user = get_user(token_data.username)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
 
 def get_current_active_user(current_user: Annotated[User, Depends(get_current_user)]):
@@ -33,6 +33,7 @@ class Settings(BaseSettings):
 
     # Application
     log_level: str = "INFO"
+    log_format: str = "text"  # 'text' (human-readable) or 'json' (one JSON object per line)
     api_v1_str: str = "/api/v1"
 
     # Sync
@@ -44,6 +45,10 @@ class Settings(BaseSettings):
     kimai_base_url: str = "http://localhost:8001"
     kimai_api_token: str = "your_kimai_api_token"
     kimai_default_project_id: int = 1
+    zammad_metadata_cache_ttl: int = 300  # Seconds to reuse Zammad orgs/activity types across syncs
+    zammad_max_inflight: int = 32  # Max concurrent Zammad API requests per connector
+    zammad_concurrency: int = 10  # Max Zammad tickets processed concurrently during a sync
+    zammad_bulk_time_accountings: bool = False  # Search all time accountings at once (not in stock Zammad)
 
     @property
     def cors_origins_list(self) -> List[str]:
@@ -37,6 +37,16 @@ class BaseConnector(ABC):
     def __init__(self, config: Dict[str, Any]):
         self.config = config
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Releases network resources (e.g. HTTP clients) held by the connector."""
+        pass
+
     @abstractmethod
     async def fetch_time_entries(self, start_date: str, end_date: str) -> List[TimeEntryNormalized]:
         """Fetches time entries from the connected system."""
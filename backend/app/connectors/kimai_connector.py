@@ -1,5 +1,7 @@
 import httpx
 import logging
+import orjson
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta, date
 
@@ -9,6 +11,9 @@ from app.utils.encrypt import decrypt_data
 
 log = logging.getLogger(__name__)
 
+# Constant query parameters for timesheet tag lookups (need tags, limit results)
+_TIMESHEET_SEARCH_PARAMS = MappingProxyType({"full": "true", "size": "10"})
+
 def _to_local_html5(dt_str: Optional[str]) -> Optional[str]:
     """
     Convert Kimai ISO-8601 (with or without timezone) to HTML5 local datetime
@@ -56,20 +61,24 @@ class KimaiConnector(BaseConnector):
         self.base_url = self._normalize_base_url(raw_base_url)
         self.api_token = self.config["api_token"]  # Already decrypted by get_connector_instance
         
-        # Create client with redirect following and extended timeout
+        # Create client with redirect following, extended timeout and auth headers installed once
         self.client = httpx.AsyncClient(
             base_url=self.base_url,
+            headers={
+                "Authorization": f"Bearer {self.api_token}",
+                "Content-Type": "application/json"
+            },
             follow_redirects=True,  # Handle 301/308 redirects automatically
             timeout=30.0,
             verify=True  # Verify SSL certificates
         )
-        self.headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json"
-        }
         
         log.info(f"Kimai connector initialized with base URL: {self.base_url}")
 
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP client and its pooled connections."""
+        await self.client.aclose()
+
     def _normalize_base_url(self, url: str) -> str:
         """
         Normalizes the base URL:
@@ -108,13 +117,18 @@ class KimaiConnector(BaseConnector):
         # Ensure path starts with /
         if not path.startswith("/"):
             path = f"/{path}"
+
+        # Encode JSON payloads with orjson (Content-Type is already set in headers)
+        if "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
         
         try:
-            log.trace(f"Kimai API {method} {self.base_url}{path}")
-            response = await self.client.request(method, path, headers=self.headers, **kwargs)
-            log.trace(f"Kimai API response: {response.status_code}")
-            response.raise_for_status()
-            return response.json()
+            log.trace("Kimai API %s %s%s", method, self.base_url, path)
+            response = await self.client.request(method, path, **kwargs)
+            log.trace("Kimai API response: %s", response.status_code)
+            if response.status_code >= 400:  # Skip raise_for_status on the success path
+                response.raise_for_status()
+            return orjson.loads(response.content)
             
         except httpx.HTTPStatusError as e:
             status = e.response.status_code
@@ -280,16 +294,16 @@ class KimaiConnector(BaseConnector):
                 tid, ta_id = marker_match.groups()
                 parsed_ticket_number = tid
                 parsed_source_id = ta_id
-                log.debug(f"Parsed marker from description: ticket={tid}, source_id={ta_id}")
+                log.debug("Parsed marker from description: ticket=%s, source_id=%s", tid, ta_id)
 
             # Fallback: Parse ticket_number from description if not from marker/tags (legacy support)
             if not parsed_ticket_number:
                 ticket_match = re.search(r"Ticket-([#]?\d+)", desc)
                 if ticket_match:
                     parsed_ticket_number = ticket_match.group(1).lstrip("#")
-                    log.debug(f"Parsed ticket_number '{parsed_ticket_number}' from description: {desc[:50]}...")
+                    log.debug("Parsed ticket_number '%s' from description: %s...", parsed_ticket_number, desc[:50])
 
-            log.debug(f"Normalized Kimai {parsed_source_id}: ticket={parsed_ticket_number}, begin_time={begin_local}")
+            log.debug("Normalized Kimai %s: ticket=%s, begin_time=%s", parsed_source_id, parsed_ticket_number, begin_local)
 
             entry_date = None
             if begin_local:
@@ -317,9 +331,8 @@ class KimaiConnector(BaseConnector):
         if normalized:
             sample = normalized[0]
             log.debug(
-                f"Kimai normalized sample id={sample.source_id} "
-                f"begin={sample.created_at} end={sample.updated_at} "
-                f"duration_min={(sample.duration_sec // 60)} tags={sample.tags}"
+                "Kimai normalized sample id=%s begin=%s end=%s duration_min=%s tags=%s",
+                sample.source_id, sample.created_at, sample.updated_at, sample.duration_sec // 60, sample.tags
             )
         log.info(f"Kimai fetch normalized {len(normalized)} entries ({params['begin']} → {params['end']}), tags included")
         return normalized
@@ -368,7 +381,7 @@ class KimaiConnector(BaseConnector):
             activity_type_id=response_data["activity"]["id"],
             activity_name=response_data["activity"]["name"],
             user_email=response_data["user"]["email"],
-            entry_date=begin_kimai_dt.strftime("%Y-%m-%d"),
+            entry_date=begin_kimai_dt.date().isoformat(),
             created_at=response_data["createdAt"],
             updated_at=response_data["updatedAt"],
             tags=response_data.get("tags", [])
@@ -409,7 +422,7 @@ class KimaiConnector(BaseConnector):
             activity_type_id=response_data["activity"]["id"],
             activity_name=response_data["activity"]["name"],
             user_email=response_data["user"]["email"],
-            entry_date=begin_kimai_dt.strftime("%Y-%m-%d"),
+            entry_date=begin_kimai_dt.date().isoformat(),
             created_at=response_data["createdAt"],
             updated_at=response_data["updatedAt"],
             tags=response_data.get("tags", [])
@@ -453,7 +466,7 @@ class KimaiConnector(BaseConnector):
             elif default_project_id:
                 # Fetch activities for specific project
                 params["project"] = str(default_project_id)
-                log.debug(f"Fetching activities for project {default_project_id} from Kimai")
+                log.debug("Fetching activities for project %s from Kimai", default_project_id)
             else:
                 # Fetch all visible activities (fallback)
                 log.debug("Fetching all visible activities from Kimai")
@@ -516,10 +529,10 @@ class KimaiConnector(BaseConnector):
             # Filter client-side for exact match on number field
             for customer in (response_data or []):
                 if customer.get("number") == external_number:
-                    log.trace(f"Found customer by number {external_number}: {customer.get('name')} (ID: {customer.get('id')})")
+                    log.trace("Found customer by number %s: %s (ID: %s)", external_number, customer.get('name'), customer.get('id'))
                     return customer
             
-            log.trace(f"No customer found with exact number: {external_number}")
+            log.trace("No customer found with exact number: %s", external_number)
             return None
         except httpx.HTTPStatusError as e:
             log.error(f"Error finding customer by number: {e.response.status_code} - {e.response.text}")
@@ -538,10 +551,10 @@ class KimaiConnector(BaseConnector):
             name_lower = name.lower()
             for customer in (response_data or []):
                 if customer.get("name", "").lower() == name_lower:
-                    log.trace(f"Found customer by exact name '{name}': ID {customer.get('id')}")
+                    log.trace("Found customer by exact name '%s': ID %s", name, customer.get('id'))
                     return customer
             
-            log.trace(f"No customer found with exact name: {name}")
+            log.trace("No customer found with exact name: %s", name)
             return None
         except httpx.HTTPStatusError as e:
             log.error(f"Error finding customer by name: {e.response.status_code} - {e.response.text}")
@@ -559,7 +572,7 @@ class KimaiConnector(BaseConnector):
         """
         try:
             response_data = await self._request("GET", f"/api/customers/{customer_id}")
-            log.trace(f"Fetched customer {customer_id}: {response_data.get('name')}")
+            log.trace("Fetched customer %s: %s", customer_id, response_data.get('name'))
             return response_data
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -603,7 +616,7 @@ class KimaiConnector(BaseConnector):
         Recommended: globalActivities=true for easier activity assignment
         """
         try:
-            log.trace(f"Kimai create_project payload: {payload}")
+            log.trace("Kimai create_project payload: %s", payload)
             response_data = await self._request("POST", "/api/projects", json=payload)
             log.info(f"Created Kimai project: {response_data.get('name')} (ID: {response_data.get('id')})")
             return response_data
@@ -626,7 +639,7 @@ class KimaiConnector(BaseConnector):
         """
         try:
             response_data = await self._request("GET", f"/api/projects/{project_id}")
-            log.trace(f"Fetched project {project_id}: globalActivities={response_data.get('globalActivities')}")
+            log.trace("Fetched project %s: globalActivities=%s", project_id, response_data.get('globalActivities'))
             return response_data
         except httpx.HTTPStatusError as e:
             log.error(f"Error fetching project {project_id}: {e.response.status_code} - {e.response.text}")
@@ -663,10 +676,10 @@ class KimaiConnector(BaseConnector):
             # Filter client-side for exact match on number field
             for project in (response_data or []):
                 if project.get("number") == project_number:
-                    log.trace(f"Found project by number {project_number}: {project.get('name')} (ID: {project.get('id')})")
+                    log.trace("Found project by number %s: %s (ID: %s)", project_number, project.get('name'), project.get('id'))
                     return project
             
-            log.trace(f"No project found with exact number: {project_number}")
+            log.trace("No project found with exact number: %s", project_number)
             return None
         except httpx.HTTPStatusError as e:
             log.error(f"Error finding project by number: {e.response.status_code} - {e.response.text}")
@@ -691,12 +704,7 @@ class KimaiConnector(BaseConnector):
             First matching timesheet or None
         """
         try:
-            params = {
-                "begin": begin,
-                "end": end,
-                "full": "true",  # Need tags
-                "size": "10"  # Limit results
-            }
+            params = {"begin": begin, "end": end, **_TIMESHEET_SEARCH_PARAMS}
             
             # Note: Kimai API doesn't support tags[] filter parameter in practice
             # We'll fetch timesheets in the range and filter client-side
@@ -718,10 +726,10 @@ class KimaiConnector(BaseConnector):
                     tags = parsed_tags
                 
                 if tag in tags:
-                    log.trace(f"Found timesheet with tag '{tag}': ID {timesheet.get('id')}")
+                    log.trace("Found timesheet with tag '%s': ID %s", tag, timesheet.get('id'))
                     return timesheet
             
-            log.trace(f"No timesheet found with tag '{tag}' in range {begin} to {end}")
+            log.trace("No timesheet found with tag '%s' in range %s to %s", tag, begin, end)
             return None
             
         except httpx.HTTPStatusError as e:
@@ -764,7 +772,7 @@ class KimaiConnector(BaseConnector):
         day_of_week = entry_date.weekday()  # 0=Monday, 6=Sunday
         rounding_days = config.get('rounding_days', [0, 1, 2, 3, 4, 5, 6])
         if day_of_week not in rounding_days:
-            log.debug(f"Rounding skipped for day {day_of_week} (not in rounding_days)")
+            log.debug("Rounding skipped for day %s (not in rounding_days)", day_of_week)
             return begin_dt, duration_sec
         
         mode = config.get('rounding_mode', 'default')
@@ -776,14 +784,14 @@ class KimaiConnector(BaseConnector):
         if round_begin_min > 0:
             rounded_begin = self._round_datetime(begin_dt, round_begin_min, mode, 'begin')
             if rounded_begin != begin_dt:
-                log.debug(f"Rounded begin: {begin_dt.strftime('%H:%M:%S')} → {rounded_begin.strftime('%H:%M:%S')} (mode={mode}, interval={round_begin_min}min)")
+                log.debug("Rounded begin: %s → %s (mode=%s, interval=%smin)", begin_dt.time(), rounded_begin.time(), mode, round_begin_min)
         
         # Round duration
         rounded_duration = duration_sec
         if round_duration_min > 0:
             rounded_duration = self._round_duration(duration_sec, round_duration_min, mode)
             if rounded_duration != duration_sec:
-                log.debug(f"Rounded duration: {duration_sec}s → {rounded_duration}s (mode={mode}, interval={round_duration_min}min)")
+                log.debug("Rounded duration: %ss → %ss (mode=%s, interval=%smin)", duration_sec, rounded_duration, mode, round_duration_min)
         
         return rounded_begin, rounded_duration
     
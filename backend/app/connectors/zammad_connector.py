@@ -1,64 +1,165 @@
+import asyncio
+import hashlib
 import httpx
 import logging
-from typing import Dict, Any, List, Optional
+import orjson
+import time
+from functools import lru_cache
+from typing import Dict, Any, Awaitable, Callable, Hashable, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 
 from app.connectors.base import BaseConnector, TimeEntryNormalized
 from app.config import settings
-from datetime import datetime
+from app.utils.timezone import BRUSSELS_TIMEZONE, BRUSSELS_TZ
 from zoneinfo import ZoneInfo
-# from app.encrypt import decrypt_data  # Assuming an encryption utility for API tokens
 
 log = logging.getLogger(__name__)
 
+# Search endpoints and query templates used on every sync
+_TICKETS_SEARCH_PATH = "/api/v1/tickets/search"
+_USERS_SEARCH_PATH = "/api/v1/users/search"
+_TIME_ACCOUNTINGS_SEARCH_PATH = "/api/v1/time_accountings/search"
+_TICKET_QUERY_TMPL = "updated_at:[{start} TO {end}]"
+_ORG_USERS_QUERY_TMPL = "organization_id:{org_id}"
+_ACCOUNTING_QUERY_TMPL = "created_at:[{start} TO {end}]"
+
+
+@lru_cache(maxsize=8192)
+def _to_local_html5(iso_timestamp: str, timezone: str = BRUSSELS_TIMEZONE) -> str:
+    """
+    Convert ISO-8601 timestamp to HTML5 local datetime in specified timezone.
+    Returns format: YYYY-MM-DDTHH:MM:SS (no timezone suffix).
+    Memoized: time accountings frequently share timestamps (e.g. via the same article).
+    """
+    try:
+        # Parse ISO timestamp (C parser; handles both Z and +00:00 formats since Python 3.11)
+        dt = datetime.fromisoformat(iso_timestamp)
+        
+        # Convert to target timezone
+        tz = BRUSSELS_TZ if timezone == BRUSSELS_TIMEZONE else ZoneInfo(timezone)
+        dt_local = dt.astimezone(tz)
+        
+        # Return as HTML5 local datetime (no timezone)
+        return dt_local.replace(tzinfo=None, microsecond=0).isoformat()
+    except Exception as e:
+        log.error(f"Failed to convert timestamp '{iso_timestamp}' to local HTML5: {e}")
+        raise
+
+
+def _minutes_to_seconds(time_unit: Any) -> int:
+    """Converts a Zammad time_unit (minutes, as a JSON number or numeric string) to whole seconds."""
+    # JSON numbers are used as-is; only string values need parsing
+    if not isinstance(time_unit, (int, float)):
+        time_unit = float(time_unit or 0)
+    return round(time_unit * 60)
+
+
+# Process-wide HTTP clients keyed by (base URL, API token), so keep-alive connections and TLS
+# sessions survive across sync runs instead of being torn down with each connector instance
+_shared_clients: Dict[Tuple[str, str], httpx.AsyncClient] = {}
+
+
+def _auth_headers(api_token: str) -> Dict[str, str]:
+    """Builds the Zammad token auth headers."""
+    return {
+        "Authorization": f"Token token={api_token}",
+        "Content-Type": "application/json"
+    }
+
+
+def _build_client(base_url: str, headers: Dict[str, str]) -> httpx.AsyncClient:
+    """Creates an HTTP client tuned for Zammad, with the auth headers bound to the client."""
+    # Keep enough idle connections alive between sync phases (search, time accountings,
+    # organizations) to avoid repeated TLS handshakes; 75s matches nginx's keepalive_timeout.
+    # HTTP/2 multiplexes concurrent requests over one connection; ALPN falls back to HTTP/1.1
+    return httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        http2=True,
+        timeout=httpx.Timeout(30, connect=5, write=10),
+        limits=httpx.Limits(max_connections=256, max_keepalive_connections=64, keepalive_expiry=75.0)
+    )
+
+
+def get_shared_client(base_url: str, api_token: str) -> httpx.AsyncClient:
+    """Returns the process-wide HTTP client for a Zammad base URL and token, creating it on first use."""
+    key = (base_url, api_token)
+    client = _shared_clients.get(key)
+    if client is None or client.is_closed:
+        client = _shared_clients[key] = _build_client(base_url, _auth_headers(api_token))
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Closes all process-wide Zammad HTTP clients (called on application shutdown)."""
+    for client in _shared_clients.values():
+        await client.aclose()
+    _shared_clients.clear()
+
+
 class ZammadConnector(BaseConnector):
     """
     Connector for Zammad ticketing system.
     Handles fetching, creating, updating, and deleting time entries in Zammad.
     """
+    # Reference data (organizations, users, org users, activity types) shared across connector
+    # instances so consecutive sync runs reuse it; keyed by (cache scope, kind, id). Like
+    # _shared_clients, the scope includes the API token, so one token's data never serves another
+    _metadata_cache: Dict[Tuple[Tuple[str, str], str, Any], Tuple[float, Any]] = {}
+    METADATA_CACHE_MAX_ENTRIES = 10000  # Expired entries are pruned once this size is reached
+    # Cache scopes whose Zammad lacks the time accounting search endpoint (404), memoized per process
+    _bulk_accounting_unsupported: Set[Tuple[str, str]] = set()
+    TICKET_SEARCH_PAGE_SIZE = 200  # Tickets per /tickets/search page
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], client: Optional[httpx.AsyncClient] = None):
         super().__init__(config)
         self.base_url = self.config["base_url"]
         self.api_token = self.config["api_token"] # In a real app, this would be decrypted
-        self.client = httpx.AsyncClient(base_url=self.base_url, timeout=30)
-        self.headers = {
-            "Authorization": f"Token token={self.api_token}",
-            "Content-Type": "application/json"
-        }
+        # (base URL, token digest) scoping the process-wide caches; the raw token is not kept as a key
+        self._cache_scope = (self.base_url, hashlib.sha256(self.api_token.encode()).hexdigest())
+        # An injected client (see get_shared_client) is owned by the caller and not closed here
+        self._owns_client = client is None
+        self.client = client if client is not None else _build_client(self.base_url, _auth_headers(self.api_token))
         self._user_cache: Dict[int, Dict[str, Any]] = {}
+        self._inflight_fetches: Dict[Hashable, asyncio.Future] = {}
+        self._metadata_ttl = settings.zammad_metadata_cache_ttl
+        self._activities_lock = asyncio.Lock()
+        self._inflight = asyncio.Semaphore(settings.zammad_max_inflight)
+        self.ticket_concurrency = settings.zammad_concurrency  # Tickets/pages processed concurrently
+        self.bulk_time_accountings = settings.zammad_bulk_time_accountings
+        self._http_version_logged = False
+        self._activity_map: Optional[Dict[int, str]] = None
         log.info(f"Zammad connector initialized with base URL: {self.base_url}")
 
-    def _to_local_html5(self, iso_timestamp: str, timezone: str = "Europe/Brussels") -> str:
-        """
-        Convert ISO-8601 timestamp to HTML5 local datetime in specified timezone.
-        Returns format: YYYY-MM-DDTHH:MM:SS (no timezone suffix).
-        """
-        try:
-            # Parse ISO timestamp (handles both Z and +00:00 formats)
-            dt = datetime.fromisoformat(iso_timestamp.replace('Z', '+00:00'))
-            
-            # Convert to target timezone
-            tz = ZoneInfo(timezone)
-            dt_local = dt.astimezone(tz)
-            
-            # Return as HTML5 local datetime (no timezone)
-            return dt_local.replace(tzinfo=None).strftime("%Y-%m-%dT%H:%M:%S")
-        except Exception as e:
-            log.error(f"Failed to convert timestamp '{iso_timestamp}' to local HTML5: {e}")
-            raise
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP client and its pooled connections, if this connector owns it."""
+        if self._owns_client:
+            await self.client.aclose()
 
     async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
         """Helper to make authenticated requests to Zammad API."""
+        # Encode JSON payloads with orjson (Content-Type is already set in headers)
+        if "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
         try:
-            response = await self.client.request(method, path, headers=self.headers, **kwargs)
-            response.raise_for_status()
-            json_data = response.json()
-            log.debug(f"Zammad API {method} {path}: {response.status_code}, returned {len(json_data)} items")
+            # Cap in-flight calls below the pool size so fan-out never starves the pool
+            async with self._inflight:
+                response = await self.client.request(method, path, **kwargs)
+            if not self._http_version_logged:
+                # Confirms whether HTTP/2 was negotiated with the Zammad server
+                self._http_version_logged = True
+                log.debug("Zammad connection to %s uses %s", self.base_url, response.http_version)
+            if response.status_code >= 400:  # Skip raise_for_status on the success path
+                response.raise_for_status()
+            json_data = orjson.loads(response.content)
+            if log.isEnabledFor(logging.DEBUG):
+                # Only lists have a meaningful item count; dicts are single records
+                size = f"{len(json_data)} items" if isinstance(json_data, list) else "1 record"
+                log.debug("Zammad API %s %s: %s, returned %s", method, path, response.status_code, size)
             return json_data
         except httpx.HTTPStatusError as e:
             full_url = str(e.request.url)
-            req_body = kwargs.get('json', kwargs.get('params', 'N/A'))
+            req_body = kwargs.get('content', kwargs.get('params', 'N/A'))
             log.error(f"Zammad API {method} {full_url} failed: {e.response.status_code}. Request body: {req_body}. Response: {e.response.text}")
             raise
         except httpx.RequestError as e:
@@ -66,14 +167,33 @@ class ZammadConnector(BaseConnector):
             log.error(f"Zammad request error {method} {full_url}: {e}")
             raise
 
+    async def _coalesced(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Runs fetch() at most once per key at a time; concurrent callers await the same in-flight task."""
+        task = self._inflight_fetches.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight_fetches[key] = task
+            task.add_done_callback(lambda _: self._inflight_fetches.pop(key, None))
+        # Shield so a cancelled caller doesn't cancel the fetch other callers are waiting on
+        return await asyncio.shield(task)
+
     async def _fetch_user(self, user_id: int) -> Dict[str, Any]:
-        """Fetches user details by ID, with caching."""
+        """
+        Fetches user details by ID. Users are kept in the cross-run metadata cache, and
+        resolved users are mirrored into self._user_cache for synchronous lookups.
+        """
         if user_id in self._user_cache:
             return self._user_cache[user_id]
+        user = await self._cached("user", user_id, lambda: self._request_user(user_id))
+        if user:
+            self._user_cache[user_id] = user
+        return user
+
+    async def _request_user(self, user_id: int) -> Dict[str, Any]:
+        """Requests user details from the Zammad API (uncached)."""
         try:
             user = await self._request("GET", f"/api/v1/users/{user_id}")
-            self._user_cache[user_id] = user
-            log.debug(f"Fetched and cached user {user_id}: {user.get('firstname', '')} {user.get('lastname', '')}")
+            log.debug("Fetched user %s: %s %s", user_id, user.get('firstname', ''), user.get('lastname', ''))
             return user
         except Exception as e:
             log.warning(f"Failed to fetch user {user_id}: {e}")
@@ -83,7 +203,7 @@ class ZammadConnector(BaseConnector):
         """Fetches article details by ID for timestamp extraction."""
         try:
             article = await self._request("GET", f"/api/v1/ticket_articles/{article_id}")
-            log.debug(f"Fetched article {article_id}: created_at={article.get('created_at')}")
+            log.debug("Fetched article %s: created_at=%s", article_id, article.get('created_at'))
             return article
         except Exception as e:
             log.warning(f"Failed to fetch article {article_id}: {e}")
@@ -96,41 +216,182 @@ class ZammadConnector(BaseConnector):
         tickets = await self.fetch_tickets_by_date(start_date, end_date)
         log.info(f"Found {len(tickets)} tickets in date range")
         
-        normalized_entries = []
-        total_time_accountings = 0
+        # Resolve organizations and customer users once per unique ID instead of per ticket
+        org_ids = list({ticket.get("organization_id") for ticket in tickets} - {None})
+        customer_ids = list({ticket.get("customer_id") for ticket in tickets} - {None})
+        orgs, customers, _, all_accountings = await asyncio.gather(
+            asyncio.gather(*(self.fetch_organization(org_id) for org_id in org_ids)),
+            asyncio.gather(*(self._fetch_customer_user(customer_id) for customer_id in customer_ids)),
+            self._get_activity_map(),
+            self.fetch_all_time_accountings(start_date, end_date)
+        )
+        org_cache: Dict[int, Optional[Dict[str, Any]]] = dict(zip(org_ids, orgs))
+        customer_cache: Dict[int, Optional[Dict[str, Any]]] = dict(zip(customer_ids, customers))
         
-        for ticket in tickets:
-            log.debug(f"Processing ticket {ticket['number']} (ID: {ticket['id']})")
+        # Tickets without a resolvable organization fall back to their customer's organization
+        fallback_org_ids = list({
+            customer_cache[ticket["customer_id"]].get("organization_id")
+            for ticket in tickets
+            if not org_cache.get(ticket.get("organization_id")) and customer_cache.get(ticket.get("customer_id"))
+        } - {None} - org_cache.keys())
+        fallback_orgs = await asyncio.gather(*(self.fetch_organization(org_id) for org_id in fallback_org_ids))
+        org_cache.update(zip(fallback_org_ids, fallback_orgs))
+        log.debug("Resolved %s organizations and %s customers for %s tickets", len(org_cache), len(customer_cache), len(tickets))
+        
+        # Concurrency bound for per-ticket requests so we don't flood the Zammad API
+        semaphore = asyncio.Semaphore(self.ticket_concurrency)
+        
+        # Group bulk-fetched accountings by ticket, or fall back to per-ticket fetches
+        accountings_by_ticket: Dict[int, List[Dict[str, Any]]]
+        if all_accountings is not None:
+            # The search spans all tickets; keep only those found by the ticket search
+            accountings_by_ticket = {ticket["id"]: [] for ticket in tickets}
+            for accounting in all_accountings:
+                ticket_accountings = accountings_by_ticket.get(accounting.get("ticket_id"))
+                if ticket_accountings is not None:
+                    ticket_accountings.append(accounting)
+        else:
+            per_ticket = await asyncio.gather(*(
+                self._fetch_ticket_accountings_bounded(ticket, start_date, end_date, semaphore) for ticket in tickets
+            ))
+            accountings_by_ticket = {ticket["id"]: accountings for ticket, accountings in zip(tickets, per_ticket)}
+        
+        # Resolve every agent referenced by the accountings once, before normalization
+        await self._prefetch_users({
+            accounting.get("created_by_id")
+            for accountings in accountings_by_ticket.values()
+            for accounting in accountings
+        } - {None})
+        
+        # Process tickets concurrently
+        results = await asyncio.gather(*(
+            self._process_ticket(
+                ticket, accountings_by_ticket.get(ticket["id"], []), start_date, org_cache, customer_cache, semaphore
+            )
+            for ticket in tickets
+        ))
+        
+        normalized_entries = [entry for ticket_entries, _ in results for entry in ticket_entries]
+        total_time_accountings = sum(count for _, count in results)
+
+        log.info(f"Total Zammad tickets processed: {len(tickets)}, total time accountings: {total_time_accountings}, normalized entries: {len(normalized_entries)}")
+        return normalized_entries
+
+    async def _get_activity_map(self) -> Dict[int, str]:
+        """Returns the activity type ID -> name map, built once per connector from fetch_activities."""
+        if self._activity_map is None:
+            try:
+                activities = await self.fetch_activities()
+            except Exception as e:
+                # Names fall back to the (possibly expanded) type on each time accounting
+                log.warning(f"Could not fetch Zammad activity types for name lookup: {e}")
+                return {}
+            self._activity_map = {activity["id"]: activity["name"] for activity in activities}
+        return self._activity_map
+
+    async def _fetch_customer_user(self, customer_id: int) -> Optional[Dict[str, Any]]:
+        """Fetches the ticket customer user (for user_emails and fallback org)."""
+        customer_user = await self._fetch_user(customer_id)
+        if not customer_user:
+            log.warning(f"Could not fetch customer user {customer_id}")
+            return None
+        log.debug("Ticket customer: %s", customer_user.get('email', 'unknown'))
+        return customer_user
+
+    async def _prefetch_users(self, user_ids: Set[int]) -> None:
+        """Fetches all given users not yet in the user cache concurrently."""
+        missing = user_ids - self._user_cache.keys()
+        if missing:
+            log.debug("Prefetching %s Zammad users", len(missing))
+            await asyncio.gather(*(self._fetch_user(user_id) for user_id in missing))
+
+    async def _fetch_ticket_accountings_bounded(
+        self,
+        ticket: Dict[str, Any],
+        start_date: str,
+        end_date: str,
+        semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """Fetches the time accountings of a single ticket under the concurrency bound."""
+        # Tickets carry their total accounted time; skip the request when it is zero
+        if "time_unit" in ticket and not float(ticket["time_unit"] or 0):
+            log.trace("Ticket %s has no accounted time, skipping time accountings fetch", ticket['number'])
+            return []
+        async with semaphore:
+            return await self.fetch_ticket_time_accountings(ticket["id"], start_date, end_date)
+
+    async def _process_ticket(
+        self,
+        ticket: Dict[str, Any],
+        time_accountings: List[Dict[str, Any]],
+        start_date: str,
+        org_cache: Dict[int, Optional[Dict[str, Any]]],
+        customer_cache: Dict[int, Optional[Dict[str, Any]]],
+        semaphore: asyncio.Semaphore
+    ) -> Tuple[List[TimeEntryNormalized], int]:
+        """
+        Normalizes the time accountings of a single ticket.
+        Returns the normalized entries and the number of time accountings in range.
+        """
+        if not time_accountings:
+            return [], 0
+        
+        async with semaphore:
+            log.debug("Processing ticket %s (ID: %s)", ticket['number'], ticket['id'])
+            
+            # Organization and customer user were resolved up-front by fetch_time_entries
+            org_id = ticket.get("organization_id")
+            org = org_cache.get(org_id) if org_id else None
+            customer_user = customer_cache.get(ticket.get("customer_id"))
+            if org_id:
+                log.debug("Ticket %s belongs to org %s", ticket['number'], org['name'] if org else 'none')
+            log.debug("Ticket %s has %s time accountings in range", ticket['number'], len(time_accountings))
             
-            # Fetch organization details if present
-            org = None
-            if ticket.get("organization_id"):
-                org = await self.fetch_organization(ticket["organization_id"])
-                log.debug(f"Ticket {ticket['number']} belongs to org {org['name'] if org else 'none'}")
+            # Per-ticket values shared by every time accounting, computed once
+            ticket_id = ticket["id"]
+            ticket_number = ticket["number"]
+            ticket_title = ticket.get("title", "")
+            default_description = f"Time tracking for ticket {ticket_number}"
+            
+            # Determine organization info
+            org_name = None
+            if org:
+                org_id = org.get("id")
+                org_name = org.get("name")
+            elif customer_user and customer_user.get("organization_id"):
+                # Customer has org but ticket doesn't reference it
+                org_id = customer_user["organization_id"]
+                user_org = org_cache.get(org_id)
+                if user_org:
+                    org_name = user_org.get("name")
+            else:
+                org_id = None
             
-            # Fetch customer user details (for user_emails and fallback org)
-            customer_user = None
-            if ticket.get("customer_id"):
-                try:
-                    customer_user = await self._request("GET", f"/api/v1/users/{ticket['customer_id']}")
-                    log.debug(f"Ticket customer: {customer_user.get('email', 'unknown')}")
-                except Exception as e:
-                    log.warning(f"Could not fetch customer user {ticket['customer_id']}: {e}")
-
-            # Fetch time accountings for this ticket
-            time_accountings = await self.fetch_ticket_time_accountings(ticket["id"], start_date, end_date)
-            total_time_accountings += len(time_accountings)
-            if len(time_accountings) > 0:
-                log.debug(f"Ticket {ticket['number']} has {len(time_accountings)} time accountings in range")
+            # Set customer_name from customer user full name
+            customer_email = None
+            customer_full_name = None
+            if customer_user:
+                customer_email = customer_user.get("email")
+                customer_first = customer_user.get('firstname', '').strip()
+                customer_last = customer_user.get('lastname', '').strip()
+                if customer_first or customer_last:
+                    customer_full_name = f"{customer_first} {customer_last}".strip()
+                    if not customer_full_name:
+                        customer_full_name = customer_user.get('login', 'Unknown Customer')
+            
+            activity_map = self._activity_map or {}
+            normalized_entries = []
+            append_entry = normalized_entries.append  # Local binding for the per-entry loop
             
             # Create individual normalized entries (NO AGGREGATION)
             for entry in time_accountings:
-                log.trace(f"Raw Zammad time accounting entry: {entry}")
+                log.trace("Raw Zammad time accounting entry: %s", entry)
                 
-                # Get time value
-                time_value = entry.get("time_unit", entry.get("time", 0))
-                if not time_value or float(time_value) <= 0:
-                    log.trace(f"Skipping zero-duration time accounting {entry.get('id')}")
+                # Get time value (converted once; zero-duration notes are skipped before any other work)
+                time_value = entry.get("time_unit", entry.get("time", 0)) or 0
+                duration_sec = _minutes_to_seconds(time_value)
+                if duration_sec <= 0:
+                    log.trace("Skipping zero-duration time accounting %s", entry.get('id'))
                     continue
                 
                 # Use the actual time_accounting ID as source_id (critical for idempotency)
@@ -146,28 +407,28 @@ class ZammadConnector(BaseConnector):
                     article = await self._fetch_article(article_id)
                     if article and article.get("created_at"):
                         created_at = article["created_at"]
-                        log.debug(f"Using article {article_id} timestamp for time_accounting {time_accounting_id}: {created_at}")
+                        log.debug("Using article %s timestamp for time_accounting %s: %s", article_id, time_accounting_id, created_at)
                     else:
                         created_at = entry.get("created_at")
-                        log.debug(f"Article {article_id} not found or no timestamp, using time_accounting created_at")
+                        log.debug("Article %s not found or no timestamp, using time_accounting created_at", article_id)
                 else:
                     created_at = entry.get("created_at")
-                    log.trace(f"No article_id for time_accounting {time_accounting_id}, using time_accounting created_at")
+                    log.trace("No article_id for time_accounting %s, using time_accounting created_at", time_accounting_id)
                 
                 updated_at = entry.get("updated_at", created_at)
                 
-                # Extract date from created_at
-                entry_date = created_at.split("T")[0] if created_at else start_date
+                # Extract date from created_at (ISO-8601, so the date is the first 10 chars)
+                entry_date = created_at[:10] if created_at else start_date
                 
                 # Convert created_at to local HTML5 for begin_time consistency with Kimai
-                begin_time_local = self._to_local_html5(created_at) if created_at else None
+                begin_time_local = _to_local_html5(created_at) if created_at else None
                 
                 # Fetch created_by user for agent details
                 created_by_id = entry.get("created_by_id")
                 user_name = None
                 user_email_agent = None
                 if created_by_id:
-                    created_by_user = await self._fetch_user(created_by_id)
+                    created_by_user = self._user_cache.get(created_by_id, {})  # Prefetched
                     user_name = f"{created_by_user.get('firstname', '')} {created_by_user.get('lastname', '')}".strip()
                     if not user_name:
                         user_name = created_by_user.get('login', 'Unknown User')
@@ -178,58 +439,33 @@ class ZammadConnector(BaseConnector):
                 
                 # Get activity info
                 activity_id = entry.get("type_id")
-                activity_name = entry.get("type", {}).get("name") if isinstance(entry.get("type"), dict) else entry.get("type", "")
+                activity_name = activity_map.get(activity_id) or (
+                    entry.get("type", {}).get("name") if isinstance(entry.get("type"), dict) else entry.get("type", "")
+                )
                 
                 # Build description
-                description = entry.get("note", "").strip()
-                if not description:
-                    description = f"Time tracking for ticket {ticket['number']}"
-                
-                # Determine organization info
-                org_id = None
-                org_name = None
-                if org:
-                    org_id = org.get("id")
-                    org_name = org.get("name")
-                elif customer_user and customer_user.get("organization_id"):
-                    # Customer has org but ticket doesn't reference it
-                    org_id = customer_user["organization_id"]
-                    try:
-                        user_org = await self.fetch_organization(org_id)
-                        if user_org:
-                            org_name = user_org.get("name")
-                    except Exception:
-                        pass
+                description = entry.get("note", "").strip() or default_description
                 
-                duration_sec = int(float(time_value) * 60)
                 user_email = user_email_agent
                 user_emails_list = [user_email_agent] if user_email_agent != "unknown@zammad.com" else []
-                if customer_user and customer_user.get("email"):
-                    user_emails_list.append(customer_user["email"])
-                
-                # Set customer_name from customer user full name
-                customer_full_name = None
-                if customer_user:
-                    customer_first = customer_user.get('firstname', '').strip()
-                    customer_last = customer_user.get('lastname', '').strip()
-                    if customer_first or customer_last:
-                        customer_full_name = f"{customer_first} {customer_last}".strip()
-                        if not customer_full_name:
-                            customer_full_name = customer_user.get('login', 'Unknown Customer')
+                if customer_email:
+                    user_emails_list.append(customer_email)
                 
                 # Calculate end_time
                 end_time_local = None
                 if begin_time_local and duration_sec > 0:
                     begin_dt = datetime.fromisoformat(begin_time_local)
                     end_dt = begin_dt + timedelta(seconds=duration_sec)
-                    end_time_local = end_dt.strftime("%Y-%m-%dT%H:%M:%S")
+                    end_time_local = end_dt.isoformat()
                 
-                normalized_entries.append(TimeEntryNormalized(
+                # Kimai-side fields (customer/project/activity IDs, tags) are left to their
+                # defaults: omitted fields skip validation entirely
+                append_entry(TimeEntryNormalized(
                     source_id=str(time_accounting_id),  # Individual time_accounting ID
                     source="zammad",
-                    ticket_number=ticket["number"],
-                    ticket_id=ticket["id"],
-                    ticket_title=ticket.get("title", ""),
+                    ticket_number=ticket_number,
+                    ticket_id=ticket_id,
+                    ticket_title=ticket_title,
                     org_id=org_id,
                     org_name=org_name,
                     user_emails=user_emails_list,
@@ -237,24 +473,18 @@ class ZammadConnector(BaseConnector):
                     duration_sec=duration_sec,
                     activity_type_id=activity_id,
                     activity_name=activity_name,
-                    customer_id=None,
-                    project_id=None,
-                    activity_id=None,
                     customer_name=customer_full_name,
-                    project_name=None,
                     user_email=user_email,
                     user_name=user_name,
                     entry_date=entry_date,
                     begin_time=begin_time_local,  # Local HTML5 for consistency
                     end_time=end_time_local,
                     created_at=created_at,  # Keep original ISO for logs
-                    updated_at=updated_at,
-                    tags=[]
+                    updated_at=updated_at
                 ))
-                log.trace(f"Normalized time_accounting {time_accounting_id}: ticket {ticket['number']}, {time_value} min, begin_time={begin_time_local}, user={user_name}")
+                log.trace("Normalized time_accounting %s: ticket %s, %s min, begin_time=%s, user=%s", time_accounting_id, ticket_number, time_value, begin_time_local, user_name)
 
-        log.info(f"Total Zammad tickets processed: {len(tickets)}, total time accountings: {total_time_accountings}, normalized entries: {len(normalized_entries)}")
-        return normalized_entries
+            return normalized_entries, len(time_accountings)
 
     async def create_time_entry(self, time_entry: TimeEntryNormalized) -> TimeEntryNormalized:
         """Creates a time entry in Zammad."""
@@ -273,10 +503,8 @@ class ZammadConnector(BaseConnector):
 
         response_data = await self._request("POST", f"/api/v1/tickets/{time_entry.ticket_id}/time_accountings", json=zammad_payload)
         # Parse Zammad response into TimeEntryNormalized. Assuming Zammad returns a similar structure.
-        created_at_dt = datetime.fromisoformat(response_data.get("created_at").replace("Z", "+00:00"))
-        updated_at_dt = datetime.fromisoformat(response_data.get("updated_at").replace("Z", "+00:00"))
 
-        duration_sec = int(float(response_data["time_unit"]) * 60)
+        duration_sec = _minutes_to_seconds(response_data["time_unit"])
         return TimeEntryNormalized(
             source_id=str(response_data["id"]),
             source="zammad",
@@ -291,7 +519,7 @@ class ZammadConnector(BaseConnector):
             customer_name=None,
             project_name=None,
             user_email=time_entry.user_email, # Zammad API might not return this directly
-            entry_date=created_at_dt.strftime("%Y-%m-%d"),
+            entry_date=response_data["created_at"][:10],  # ISO-8601 date prefix
             created_at=response_data["created_at"],
             updated_at=response_data["updated_at"],
             # Tags typically not supported directly in Zammad time accountings, managed at Kimai side
@@ -311,9 +539,8 @@ class ZammadConnector(BaseConnector):
         # Similar to create, description updates might require different Zammad API calls.
 
         response_data = await self._request("PUT", f"/api/v1/tickets/{time_entry.ticket_id}/time_accountings/{time_entry.source_id}", json=zammad_payload)
-        updated_at_dt = datetime.fromisoformat(response_data.get("updated_at").replace("Z", "+00:00"))
 
-        duration_sec = int(float(response_data["time_unit"]) * 60)
+        duration_sec = _minutes_to_seconds(response_data["time_unit"])
         return TimeEntryNormalized(
             source_id=str(response_data["id"]),
             source="zammad",
@@ -328,7 +555,7 @@ class ZammadConnector(BaseConnector):
             customer_name=None,
             project_name=None,
             user_email=time_entry.user_email,
-            entry_date=updated_at_dt.strftime("%Y-%m-%d"),
+            entry_date=response_data["updated_at"][:10],  # ISO-8601 date prefix
             created_at=response_data["created_at"],
             updated_at=response_data["updated_at"],
             tags=time_entry.tags
@@ -348,23 +575,54 @@ class ZammadConnector(BaseConnector):
         """
         Validates the connection to Zammad by trying to fetch a user and activities.
         """
-        try:
-            # Basic connection test
-            await self._request("GET", "/api/v1/users/me")
-            
-            # Test activities fetch permissions
-            activities = await self.fetch_activities()
-            if not activities:
-                raise ValueError("Connection successful but no activities available. Check API token permissions for time accounting types.")
-            
-            return True
-        except ValueError:
-            raise  # Re-raise ValueError for specific handling
-        except Exception:
+        # Basic connection test and activities permission test are independent,
+        # so run both probes concurrently
+        me_result, activities = await asyncio.gather(
+            self._request("GET", "/api/v1/users/me"),
+            self.fetch_activities(),
+            return_exceptions=True
+        )
+        if isinstance(me_result, BaseException):
+            return False
+        if isinstance(activities, ValueError):
+            raise activities  # Re-raise ValueError for specific handling
+        if isinstance(activities, BaseException):
             return False
+        if not activities:
+            raise ValueError("Connection successful but no activities available. Check API token permissions for time accounting types.")
+        
+        return True
+
+    async def _cached(self, kind: str, key: Any, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the cached value for (kind, key) if younger than the metadata TTL,
+        otherwise awaits fetch() and caches the result. Empty results (errors) are not cached.
+        """
+        cache_key = (self._cache_scope, kind, key)
+        cached = self._metadata_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self._metadata_ttl:
+            log.trace("Zammad metadata cache hit: %s %s", kind, key)
+            return cached[1]
+        value = await self._coalesced(cache_key, fetch)
+        if value:
+            now = time.monotonic()
+            if len(self._metadata_cache) >= self.METADATA_CACHE_MAX_ENTRIES:
+                # Users make the cache grow with the instance size; drop expired entries
+                for stale_key in [k for k, (ts, _) in self._metadata_cache.items() if now - ts >= self._metadata_ttl]:
+                    del self._metadata_cache[stale_key]
+            self._metadata_cache[cache_key] = (now, value)
+        return value
 
     async def fetch_activities(self) -> List[Dict[str, Any]]:
-        """Fetches available activity types from Zammad."""
+        """
+        Fetches available activity types from Zammad, cached for the metadata TTL.
+        Concurrent callers share a single in-flight request.
+        """
+        async with self._activities_lock:
+            return await self._cached("activities", None, self._request_activities)
+
+    async def _request_activities(self) -> List[Dict[str, Any]]:
+        """Requests active activity types from the Zammad API (uncached)."""
         try:
             # Zammad uses "/api/v1/time_accounting/types" for types
             response_data = await self._request("GET", "/api/v1/time_accounting/types")
@@ -394,29 +652,63 @@ class ZammadConnector(BaseConnector):
             httpx.HTTPStatusError: For HTTP errors (401, 404, 500, etc.)
             Exception: For other unexpected errors
         """
-        log.debug(f"Searching Zammad tickets for date range: {start_date} to {end_date}")
-        # Zammad search API to find tickets updated in the date range
+        log.debug("Searching Zammad tickets for date range: %s to %s", start_date, end_date)
+        query = _TICKET_QUERY_TMPL.format(start=start_date, end=end_date)
+        tickets = await self._search_tickets_page(query, 1)
+        
+        page_size = self.TICKET_SEARCH_PAGE_SIZE
+        
+        if len(tickets) >= page_size:
+            # The search reports no grand total: fetch windows of pages concurrently until a short one
+            # comes back. The window size bounds the requests in flight and the surplus pages requested.
+            next_page = 2
+            more = True
+            while more:
+                window = range(next_page, next_page + self.ticket_concurrency)
+                for page_tickets in await asyncio.gather(*(self._search_tickets_page(query, page) for page in window)):
+                    tickets.extend(page_tickets)
+                    if len(page_tickets) < page_size:
+                        more = False
+                        break
+                next_page += self.ticket_concurrency
+        
+        # Tickets updated while paging can shift between pages; de-duplicate by ID
+        unique_tickets = list({ticket["id"]: ticket for ticket in tickets}.values())
+        log.info(f"Found {len(unique_tickets)} tickets in date range")
+        return unique_tickets
+
+    async def _search_tickets_page(self, query: str, page: int) -> List[Dict[str, Any]]:
+        """Fetches one page of ticket search results."""
         # Using search endpoint: /api/v1/tickets/search
+        # No expand: we only read plain ticket attributes, not the resolved relation names
         params = {
-            "query": f"updated_at:[{start_date} TO {end_date}]",
-            "limit": 1000,  # Adjust based on expected volume
-            "expand": True
+            "query": query,
+            "page": page,
+            "per_page": self.TICKET_SEARCH_PAGE_SIZE
         }
-        response_data = await self._request("GET", "/api/v1/tickets/search", params=params)
+        response_data = await self._request("GET", _TICKETS_SEARCH_PATH, params=params)
         
         # Response should be a list of tickets or contain a 'tickets' key
         if isinstance(response_data, list):
-            log.info(f"Found {len(response_data)} tickets in date range")
             return response_data
         elif isinstance(response_data, dict) and "tickets" in response_data:
-            log.info(f"Found {len(response_data['tickets'])} tickets in date range")
-            return response_data["tickets"]
+            # tickets_count is the size of this page, not the number of matches, so it can't bound paging
+            tickets = response_data["tickets"]
+            # Non-expanded search returns ticket IDs, with the ticket records under assets
+            ticket_assets = response_data.get("assets", {}).get("Ticket", {})
+            if ticket_assets:
+                tickets = [ticket_assets[str(ticket_id)] for ticket_id in tickets if str(ticket_id) in ticket_assets]
+            return tickets
         else:
             log.warning(f"Unexpected response format from Zammad tickets search: {type(response_data)}")
             return []
 
     async def fetch_organization(self, org_id: int) -> Optional[Dict[str, Any]]:
-        """Fetches organization details by ID."""
+        """Fetches organization details by ID, cached for the metadata TTL."""
+        return await self._cached("organization", org_id, lambda: self._request_organization(org_id))
+
+    async def _request_organization(self, org_id: int) -> Optional[Dict[str, Any]]:
+        """Requests organization details from the Zammad API (uncached)."""
         try:
             response_data = await self._request("GET", f"/api/v1/organizations/{org_id}")
             return response_data
@@ -425,14 +717,18 @@ class ZammadConnector(BaseConnector):
             return None
 
     async def fetch_users_by_org(self, org_id: int) -> List[Dict[str, Any]]:
-        """Fetches users belonging to an organization."""
+        """Fetches users belonging to an organization, cached for the metadata TTL."""
+        return await self._cached("org_users", org_id, lambda: self._request_users_by_org(org_id))
+
+    async def _request_users_by_org(self, org_id: int) -> List[Dict[str, Any]]:
+        """Requests users belonging to an organization from the Zammad API (uncached)."""
         try:
             # Zammad API to search users by organization_id
             params = {
-                "query": f"organization_id:{org_id}",
+                "query": _ORG_USERS_QUERY_TMPL.format(org_id=org_id),
                 "limit": 100
             }
-            response_data = await self._request("GET", "/api/v1/users/search", params=params)
+            response_data = await self._request("GET", _USERS_SEARCH_PATH, params=params)
             
             if isinstance(response_data, list):
                 return response_data
@@ -444,29 +740,71 @@ class ZammadConnector(BaseConnector):
             log.error(f"Error fetching users for organization {org_id}: {e}")
             return []
 
+    async def fetch_all_time_accountings(self, start_date: str, end_date: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetches all time accountings created in the date range with paged search requests.
+        Stock Zammad has no time accounting search endpoint, so this is opt-in
+        (ZAMMAD_BULK_TIME_ACCOUNTINGS). Returns None when disabled or unsupported, so callers
+        fall back to fetch_ticket_time_accountings.
+        """
+        if not self.bulk_time_accountings or self._cache_scope in self._bulk_accounting_unsupported:
+            return None
+        
+        query = _ACCOUNTING_QUERY_TMPL.format(start=start_date, end=end_date)
+        accountings: List[Dict[str, Any]] = []
+        page = 1
+        while True:
+            params = {"query": query, "page": page, "per_page": self.TICKET_SEARCH_PAGE_SIZE}
+            try:
+                response_data = await self._request("GET", _TIME_ACCOUNTINGS_SEARCH_PATH, params=params)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    log.info("Zammad at %s has no time accounting search endpoint, using per-ticket fetches", self.base_url)
+                    self._bulk_accounting_unsupported.add(self._cache_scope)
+                else:
+                    log.warning(f"Bulk time accounting search failed, using per-ticket fetches: {e}")
+                return None
+            except Exception as e:
+                log.warning(f"Bulk time accounting search failed, using per-ticket fetches: {e}")
+                return None
+            
+            if not isinstance(response_data, list) or any("ticket_id" not in entry for entry in response_data):
+                log.info("Unexpected time accounting search response from %s, using per-ticket fetches", self.base_url)
+                self._bulk_accounting_unsupported.add(self._cache_scope)
+                return None
+            
+            accountings.extend(response_data)
+            if len(response_data) < self.TICKET_SEARCH_PAGE_SIZE:
+                break
+            page += 1
+        
+        # Same date filter as fetch_ticket_time_accountings (ISO-8601 prefixes compare as strings)
+        filtered = [entry for entry in accountings if start_date <= (entry.get("created_at") or "")[:10] <= end_date]
+        log.debug("Fetched %s time accountings in bulk (%s in date range)", len(accountings), len(filtered))
+        return filtered
+
     async def fetch_ticket_time_accountings(self, ticket_id: int, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """Fetches time accounting entries for a specific ticket within the date range."""
         try:
-            log.debug(f"Fetching time accountings for ticket {ticket_id}")
+            log.debug("Fetching time accountings for ticket %s", ticket_id)
             # Zammad API endpoint for ticket time accountings
             response_data = await self._request("GET", f"/api/v1/tickets/{ticket_id}/time_accountings")
-            log.debug(f"Received {len(response_data)} time accountings for ticket {ticket_id}")
+            log.debug("Received %s time accountings for ticket %s", len(response_data), ticket_id)
             
-            # Filter by date range
+            # Filter by date range (ISO-8601 date prefixes compare correctly as strings)
             if isinstance(response_data, list):
                 filtered = [
                     entry for entry in response_data
-                    if entry.get("created_at", "").split("T")[0] >= start_date
-                    and entry.get("created_at", "").split("T")[0] <= end_date
+                    if start_date <= (entry.get("created_at") or "")[:10] <= end_date
                 ]
-                log.trace(f"Filtered to {len(filtered)} time accountings in date range {start_date} to {end_date}")
+                log.trace("Filtered to %s time accountings in date range %s to %s", len(filtered), start_date, end_date)
                 return filtered
             else:
                 log.warning(f"Unexpected response format from ticket time accountings: {type(response_data)}")
                 return []
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
-                log.trace(f"No time accountings found for ticket {ticket_id} (404)")
+                log.trace("No time accountings found for ticket %s (404)", ticket_id)
                 # Ticket has no time accountings
                 return []
             else:
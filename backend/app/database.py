@@ -1,23 +1,45 @@
 """Database connection and session management."""
 
+from typing import Tuple
+
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
+
+def _json_serializer(value) -> str:
+    """Encodes JSON/JSONB column values (audit details, conflict payloads) with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create database engine
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,  # Verify connections before using
     pool_size=10,
-    max_overflow=20
+    max_overflow=20,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads
 )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+class _ReprBase:
+    """Shared __repr__ for all models, showing the attributes named in _repr_fields."""
+
+    _repr_fields: Tuple[str, ...] = ("id",)
+
+    def __repr__(self):
+        state = self.__dict__  # Loaded values only: repr never triggers a lazy load or refresh
+        fields = ", ".join(f"{name}={state.get(name)!r}" for name in self._repr_fields)
+        return f"<{type(self).__name__}({fields})>"
+
+
 # Base class for models
-Base = declarative_base()
+Base = declarative_base(cls=_ReprBase)
 
 
 def get_db():
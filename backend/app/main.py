@@ -1,12 +1,15 @@
 """Main FastAPI application."""
 
 import logging
+import orjson
 
-from datetime import datetime, timedelta
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
 from typing import Annotated
 
-from fastapi import Depends, FastAPI, HTTPException, status, Request
+from fastapi import Depends, FastAPI, HTTPException, status, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 
 from app.api.v1.api import api_router
@@ -16,18 +19,29 @@ from app.auth import create_access_token, authenticate_user, get_current_active_
 from app.schemas.auth import Token, User
 from app.database import get_db
 from app.utils.audit_logger import create_audit_log
+from app.utils.log_formatter import JsonLogFormatter
 from sqlalchemy.orm import Session
 
-# Custom TRACE level
-logging.TRACE = 5
-logging.addLevelName(logging.TRACE, "TRACE")
+log = logging.getLogger(__name__)
+
+# Custom TRACE level (registered once, even if this module is imported again)
+if not hasattr(logging, "TRACE"):
+    logging.TRACE = 5
+    logging.addLevelName(logging.TRACE, "TRACE")
 
 # Add trace method to standard Logger class for all instances
 def trace_method(self, msg, *args, **kwargs):
     if self.isEnabledFor(logging.TRACE):
         self._log(logging.TRACE, msg, args, **kwargs)
 
-logging.Logger.trace = trace_method
+if not hasattr(logging.Logger, "trace"):
+    logging.Logger.trace = trace_method
+
+# Levels for (root, httpcore, httpx, app.connectors, app.services.sync_service) in the debug modes
+_DEBUG_MODE_LEVELS = {
+    "VERBOSE": (logging.DEBUG, logging.DEBUG, logging.DEBUG, logging.TRACE, logging.DEBUG),
+    "TRACE": (logging.TRACE, logging.TRACE, logging.TRACE, logging.TRACE, logging.TRACE),
+}
 
 # Configure root logger early
 log_level_str = settings.log_level.upper()
@@ -39,21 +53,20 @@ if not logging.getLogger().hasHandlers():
     )
 
     root = logging.getLogger()
-
-    # Handle VERBOSE mode and set specific loggers
-    if log_level_str == "VERBOSE":
-        root_level = logging.DEBUG
-        httpcore_level = logging.DEBUG
-        httpx_level = logging.DEBUG
-        connectors_level = logging.TRACE
-        sync_level = logging.DEBUG
-        root.info("VERBOSE mode enabled: HTTP details and connector traces active for debugging.")
-    elif log_level_str == "TRACE":
-        root_level = logging.TRACE
-        httpcore_level = logging.TRACE
-        httpx_level = logging.TRACE
-        connectors_level = logging.TRACE
-        sync_level = logging.TRACE
+    if settings.log_format.lower() == "json":
+        for handler in root.handlers:
+            handler.setFormatter(JsonLogFormatter())
+
+    # Neither format uses thread/process fields; skip collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Handle VERBOSE/TRACE modes and set specific loggers
+    if log_level_str in _DEBUG_MODE_LEVELS:
+        root_level, httpcore_level, httpx_level, connectors_level, sync_level = _DEBUG_MODE_LEVELS[log_level_str]
+        if log_level_str == "VERBOSE":
+            root.info("VERBOSE mode enabled: HTTP details and connector traces active for debugging.")
     else:
         root_level = log_level
         httpcore_level = logging.WARNING
@@ -70,24 +83,40 @@ if not logging.getLogger().hasHandlers():
 
     root.trace("Trace logging enabled at startup (verbose details).") if log_level_str == "TRACE" else root.debug("Debug logging enabled at startup.")
 
+# Import scheduler
+from app import scheduler as sched_module
+from app.connectors.zammad_connector import close_shared_clients, get_shared_client
+
+# Application lifecycle: scheduler and shared HTTP clients
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the scheduler on startup; shut it down and release shared HTTP clients on shutdown."""
+    sched_module.start_scheduler()
+    try:
+        yield
+    finally:
+        sched_module.shutdown_scheduler()
+        await close_shared_clients()
+
 app = FastAPI(
     title="Zammad-Kimai Time Tracking Sync",
     description="Synchronization service for time tracking between Zammad and Kimai",
-    version=__version__
+    version=__version__,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Import scheduler
-from app import scheduler as sched_module
-
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
+    allow_origins=frozenset(settings.cors_origins_list),  # Set: O(1) Origin lookup per request
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+_ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.access_token_expire_minutes)
+
 @app.post("/token", response_model=Token)
 async def login_for_access_token(
     request: Request,
@@ -118,9 +147,8 @@ async def login_for_access_token(
         user=user.username
     )
     
-    access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
+        data={"sub": user.username}, expires_delta=_ACCESS_TOKEN_EXPIRES
     )
     
     # TODO: Implement rate limiting for failed login attempts
@@ -133,13 +161,13 @@ async def login_for_access_token(
 async def read_users_me(current_user: Annotated[User, Depends(get_current_active_user)]):
     return current_user
 
+# Health probes hit this constantly; serialize the constant body once
+_HEALTH_BYTES = orjson.dumps({"status": "healthy", "version": __version__})
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "version": __version__
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 @app.get("/")
 async def root():
@@ -152,46 +180,24 @@ async def root():
 
 app.include_router(api_router, prefix=settings.api_v1_str)
 
-import logging
-
-log = logging.getLogger(__name__)
-
-from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
-
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    log.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    log.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
 
-# Lifecycle events for scheduler
-@app.on_event("startup")
-async def startup_event():
-    """Start the scheduler on application startup."""
-    sched_module.start_scheduler()
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Shutdown the scheduler on application shutdown."""
-    sched_module.shutdown_scheduler()
-
 # Scheduler setup (runs only when main.py executed directly, not in production uvicorn)
 if __name__ == "__main__":
     import uvicorn
-    from contextlib import asynccontextmanager
     from apscheduler.schedulers.asyncio import AsyncIOScheduler
     from apscheduler.triggers.interval import IntervalTrigger
     from app.api.v1.endpoints.connectors import CONNECTOR_TYPES
     from app.services.normalizer import NormalizerService
     from app.services.reconciler import ReconciliationService
     from app.services.sync_service import SyncService
-    from app.database import get_db
-    import logging
-
-    log = logging.getLogger(__name__)
+    from app.database import SessionLocal
 
     # Placeholder for SyncService creation
     @asynccontextmanager
@@ -199,47 +205,50 @@ if __name__ == "__main__":
         zammad_config = {"base_url": settings.zammad_base_url, "api_token": settings.zammad_api_token}
         kimai_config = {"base_url": settings.kimai_base_url, "api_token": settings.kimai_api_token, "default_project_id": settings.kimai_default_project_id}
         
-        db_gen = get_db()
-        db_session = next(db_gen)
-
-        try:
-            sync_service = SyncService(
-                zammad_connector=CONNECTOR_TYPES["zammad"](zammad_config),
-                kimai_connector=CONNECTOR_TYPES["kimai"](kimai_config),
-                normalizer_service=NormalizerService(),
-                reconciliation_service=ReconciliationService(),
-                db=db_session
-            )
-            yield sync_service
-        finally:
-            db_session.close()
+        # Plain session (no dependency generator); it only connects on first query
+        with SessionLocal() as db_session:
+            zammad_client = get_shared_client(settings.zammad_base_url, settings.zammad_api_token)
+            async with CONNECTOR_TYPES["zammad"](zammad_config, client=zammad_client) as zammad_connector, \
+                    CONNECTOR_TYPES["kimai"](kimai_config) as kimai_connector:
+                yield SyncService(
+                    zammad_connector=zammad_connector,
+                    kimai_connector=kimai_connector,
+                    normalizer_service=NormalizerService(),
+                    reconciliation_service=ReconciliationService(),
+                    db=db_session
+                )
 
     async def periodic_sync_task():
-        log.info(f"Running scheduled sync task at {datetime.now()}...")
+        log.info("Running scheduled sync task at %s...", datetime.now())
         async with get_sync_service_context() as sync_service:
-            today = datetime.now()
+            today = date.today()
             thirty_days_ago = today - timedelta(days=30)
             await sync_service.sync_time_entries(
-                thirty_days_ago.strftime("%Y-%m-%d"),
-                today.strftime("%Y-%m-%d")
+                thirty_days_ago.isoformat(),
+                today.isoformat()
             )
 
-    @app.on_event("startup")
-    async def startup_event():
-        scheduler = AsyncIOScheduler()
-        scheduler.add_job(
-            periodic_sync_task,
-            IntervalTrigger(hours=settings.sync_schedule_hours),
-            id="periodic_sync_job"
-        )
-        scheduler.start()
-        log.info(f"Scheduler started. Sync task scheduled every {settings.sync_schedule_hours} hours.")
-
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        scheduler = AsyncIOScheduler()
-        if scheduler.running:
-            scheduler.shutdown()
-            log.info("Scheduler shut down.")
+    # Missed runs collapse into one
+    scheduler = AsyncIOScheduler(job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 60})
+
+    @asynccontextmanager
+    async def standalone_lifespan(app: FastAPI):
+        """Runs the application lifespan plus the interval-based periodic sync."""
+        async with lifespan(app):
+            scheduler.add_job(
+                periodic_sync_task,
+                IntervalTrigger(hours=settings.sync_schedule_hours),
+                id="periodic_sync_job"
+            )
+            scheduler.start()
+            log.info("Scheduler started. Sync task scheduled every %s hours.", settings.sync_schedule_hours)
+            try:
+                yield
+            finally:
+                if scheduler.running:
+                    scheduler.shutdown()
+                    log.info("Scheduler shut down.")
+
+    app.router.lifespan_context = standalone_lifespan
 
     uvicorn.run(app, host="0.0.0.0", port=8000, log_level=settings.log_level.lower())
@@ -1,6 +1,6 @@
 """Audit log model for tracking all system operations."""
 
-from sqlalchemy import Column, Integer, String, DateTime, Index
+from sqlalchemy import Column, Integer, String, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.database import Base
@@ -10,6 +10,7 @@ class AuditLog(Base):
     """Audit trail for all system operations."""
 
     __tablename__ = "audit_logs"
+    _repr_fields = ('id', 'action', 'entity_type')
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -27,13 +28,13 @@ class AuditLog(Base):
     user_agent = Column(String, nullable=True)  # Browser/client user agent
     
     # Timestamp
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     __table_args__ = (
+        # Single btree on created_at: serves the newest-first listing and date range filters
         Index('idx_audit_logs_created_at_desc', created_at.desc()),
         Index('idx_audit_logs_action', 'action'),
         Index('idx_audit_logs_ip_created', 'ip_address', 'created_at'),
+        # Partial index for access-log retention cleanup (same predicate as cleanup_old_access_logs)
+        Index('idx_audit_logs_access_created', 'created_at', postgresql_where=text("action NOT LIKE 'sync%'")),
     )
-
-    def __repr__(self):
-        return f"<AuditLog(id={self.id}, action='{self.action}', entity='{self.entity_type}')>"
@@ -1,6 +1,6 @@
 """Conflict model for tracking reconciliation conflicts."""
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index, Float, Date
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index, Float, Date, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -11,6 +11,7 @@ class Conflict(Base):
     """Detected conflicts during reconciliation that require manual resolution."""
 
     __tablename__ = "conflicts"
+    _repr_fields = ('id', 'conflict_type', 'resolution_status')
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -52,9 +53,10 @@ class Conflict(Base):
     time_entry = relationship("TimeEntry", back_populates="conflicts")
 
     __table_args__ = (
-        Index('idx_conflicts_resolution_status', 'resolution_status'),
+        # Only pending rows are worked on by the reconcile queue; resolved ones pile up and are never listed there
+        Index('idx_conflicts_pending_type', 'conflict_type', postgresql_where=text("resolution_status = 'pending'")),
         Index('idx_conflicts_reason_code', 'reason_code'),
+        # Pending-conflict deduplication lookups during sync
+        Index('idx_conflicts_ticket_status', 'ticket_number', 'resolution_status'),
+        Index('idx_conflicts_created_status', 'zammad_created_at', 'resolution_status'),
     )
-
-    def __repr__(self):
-        return f"<Conflict(id={self.id}, type='{self.conflict_type}', status='{self.resolution_status}')>"
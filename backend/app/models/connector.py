@@ -11,6 +11,7 @@ class Connector(Base):
     """Connector configuration for external systems (Zammad, Kimai, etc.)."""
 
     __tablename__ = "connectors"
+    _repr_fields = ('id', 'name', 'type')
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
@@ -24,6 +25,3 @@ class Connector(Base):
 
     # Relationships
     time_entries = relationship("TimeEntry", back_populates="connector", cascade="all, delete-orphan")
-
-    def __repr__(self):
-        return f"<Connector(id={self.id}, name='{self.name}', type='{self.type}')>"
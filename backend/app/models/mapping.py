@@ -9,6 +9,7 @@ class ActivityMapping(Base):
     """Mapping between Zammad activity types and Kimai activities."""
 
     __tablename__ = "activity_mappings"
+    _repr_fields = ('id', 'zammad_type_name', 'kimai_activity_name')
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -30,6 +31,3 @@ class ActivityMapping(Base):
     __table_args__ = (
         UniqueConstraint('zammad_type_id', 'kimai_activity_id', name='uq_zammad_kimai_mapping'),
     )
-
-    def __repr__(self):
-        return f"<ActivityMapping(id={self.id}, zammad={self.zammad_type_name}, kimai={self.kimai_activity_name})>"
@@ -9,6 +9,7 @@ class Schedule(Base):
     """Periodic sync schedule configuration."""
 
     __tablename__ = "schedules"
+    _repr_fields = ('id', 'cron', 'enabled')
 
     id = Column(Integer, primary_key=True, index=True)
     cron = Column(String(100), nullable=False)
@@ -18,6 +19,3 @@ class Schedule(Base):
     enabled = Column(Boolean, nullable=False, default=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-
-    def __repr__(self):
-        return f"<Schedule(id={self.id}, cron='{self.cron}', enabled={self.enabled})>"
@@ -9,6 +9,7 @@ class SyncRun(Base):
     """Sync execution history and status tracking."""
 
     __tablename__ = "sync_runs"
+    _repr_fields = ('id', 'trigger_type', 'status', 'entries_synced')
 
     id = Column(Integer, primary_key=True, index=True)
     
@@ -31,6 +32,3 @@ class SyncRun(Base):
     
     # Timestamp
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-
-    def __repr__(self):
-        return f"<SyncRun(id={self.id}, trigger='{self.trigger_type}', status='{self.status}', synced={self.entries_synced})>"
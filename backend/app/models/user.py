@@ -8,6 +8,7 @@ class User(Base):
     """User model for admin authentication."""
 
     __tablename__ = "users"
+    _repr_fields = ('id', 'username')
 
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(100), unique=True, nullable=False, index=True)
@@ -15,6 +16,3 @@ class User(Base):
     email = Column(String(255), unique=True, nullable=True)
     hashed_password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
-
-    def __repr__(self):
-        return f"<User(id={self.id}, username='{self.username}')>"
@@ -1,41 +1,101 @@
 """APScheduler integration for periodic sync jobs."""
 
 import logging
-from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
+from datetime import date, datetime, timedelta
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import engine, get_db
 from app.models.connector import Connector
 from app.models.sync_run import SyncRun
-from app.connectors.zammad_connector import ZammadConnector
+from app.connectors.zammad_connector import ZammadConnector, get_shared_client
 from app.connectors.kimai_connector import KimaiConnector
 from app.services.sync_service import SyncService
 from app.services.normalizer import NormalizerService
 from app.services.reconciler import ReconciliationService
 from app.utils.encrypt import decrypt_data
+from app.utils.timezone import BRUSSELS_TZ
 
 log = logging.getLogger(__name__)
 
-# Global scheduler instance
-scheduler = AsyncIOScheduler()
+# Global scheduler instance (missed runs collapse into one late run instead of being dropped)
+scheduler = AsyncIOScheduler(job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 60})
 
 # Concurrency management
 _sync_running = False  # Guard for 'skip' mode
 _sync_queue = []  # Queue for 'queue' mode
 
+# Postgres advisory lock key shared by all replicas for the scheduled sync
+SCHEDULED_SYNC_LOCK_KEY = 7_301_452_913
+
+
+def _try_acquire_cluster_lock() -> Optional[Connection]:
+    """
+    Take the cluster-wide scheduled sync lock, so only one replica runs each scheduled sync.
+
+    Returns the connection holding the lock (released with _release_cluster_lock), or None if
+    another replica holds it. The lock is session-level: if the holder dies, Postgres drops it
+    together with the connection, so there is no lease to refresh or expire.
+    """
+    conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+    if engine.dialect.name != "postgresql":
+        return conn  # Single-node setups (e.g. SQLite) have no other replica to coordinate with
+    try:
+        acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": SCHEDULED_SYNC_LOCK_KEY}).scalar()
+    except Exception:
+        # The lock state is unknown: discard the connection rather than pool it possibly still holding the lock
+        conn.invalidate()
+        conn.close()
+        raise
+    if not acquired:
+        conn.close()
+        return None
+    return conn
+
+
+def _release_cluster_lock(conn: Optional[Connection]) -> None:
+    """Release the scheduled sync lock taken by _try_acquire_cluster_lock."""
+    if conn is None:
+        return
+    try:
+        if engine.dialect.name == "postgresql":
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": SCHEDULED_SYNC_LOCK_KEY})
+    except Exception as e:
+        # A pooled connection would keep holding the session-level lock and block every later
+        # scheduled sync; invalidating it closes the session, so Postgres releases the lock
+        log.warning("Failed to release scheduled sync lock, discarding its connection: %s", e)
+        conn.invalidate()
+    finally:
+        conn.close()
+
 
 async def scheduled_sync_job():
     """Execute scheduled sync with concurrency handling."""
+    await _run_scheduled_sync()
+    
+    # Drain runs queued while the previous one was active, one after another
+    # (each run opens and closes its own session)
+    while _sync_queue and not _sync_running:
+        _sync_queue.pop(0)
+        log.info("Processing queued sync job")
+        await _run_scheduled_sync()
+
+
+async def _run_scheduled_sync():
+    """Run a single scheduled sync, honouring the schedule's concurrency mode."""
     global _sync_running, _sync_queue
     
     from app.models.schedule import Schedule
     
     db_gen = get_db()
     db = next(db_gen)
+    cluster_lock = None
     
     try:
         # Get schedule config
@@ -53,23 +113,28 @@ async def scheduled_sync_job():
             if _sync_running:
                 if len(_sync_queue) < 5:  # Prevent unbounded queue
                     _sync_queue.append(datetime.now())
-                    log.info(f"Scheduled sync queued (queue size: {len(_sync_queue)})")
+                    log.info("Scheduled sync queued (queue size: %d)", len(_sync_queue))
                 else:
                     log.warning("Scheduled sync queue full, skipping")
                 return
         
+        # Other replicas run the same schedule; only the lock holder syncs
+        cluster_lock = _try_acquire_cluster_lock()
+        if cluster_lock is None:
+            log.info("Scheduled sync skipped: another instance is already running it")
+            return
+        
         _sync_running = True
         log.info("Starting scheduled sync job")
         
-        # Fetch connectors
-        zammad_conn = db.query(Connector).filter(
-            Connector.type == "zammad", 
+        # Fetch both connectors in one query (descending id, so the oldest active one per type wins)
+        active_conns = db.query(Connector).filter(
+            Connector.type.in_(("zammad", "kimai")),
             Connector.is_active == True
-        ).first()
-        kimai_conn = db.query(Connector).filter(
-            Connector.type == "kimai", 
-            Connector.is_active == True
-        ).first()
+        ).order_by(Connector.id.desc()).all()
+        conns_by_type = {conn.type: conn for conn in active_conns}
+        zammad_conn = conns_by_type.get("zammad")
+        kimai_conn = conns_by_type.get("kimai")
         
         if not zammad_conn or not kimai_conn:
             log.error("Scheduled sync failed: connectors not configured")
@@ -83,13 +148,13 @@ async def scheduled_sync_job():
         # Create sync run
         sync_run = SyncRun(
             trigger_type='scheduled',
-            start_time=datetime.now(ZoneInfo('Europe/Brussels')),
+            start_time=datetime.now(BRUSSELS_TZ),
             status='running'
         )
         db.add(sync_run)
         db.commit()
         
-        log.info(f"Starting scheduled sync run #{sync_run.id}")
+        log.info("Starting scheduled sync run #%s", sync_run.id)
         
         # Instantiate connectors
         zammad_config = {
@@ -103,29 +168,28 @@ async def scheduled_sync_job():
             "settings": kimai_conn.settings or {}
         }
         
-        zammad_instance = ZammadConnector(zammad_config)
-        kimai_instance = KimaiConnector(kimai_config)
-        
-        # Create sync service
-        sync_service = SyncService(
-            zammad_connector=zammad_instance,
-            kimai_connector=kimai_instance,
-            normalizer_service=NormalizerService(),
-            reconciliation_service=ReconciliationService(),
-            db=db
-        )
-        
-        # Sync last 30 days
-        today = datetime.now()
-        thirty_days_ago = today - timedelta(days=30)
-        stats = await sync_service.sync_time_entries(
-            thirty_days_ago.strftime("%Y-%m-%d"),
-            today.strftime("%Y-%m-%d"),
-            sync_run,
-            trigger_type='scheduled'
-        )
+        async with ZammadConnector(zammad_config, client=get_shared_client(zammad_config["base_url"], zammad_token)) as zammad_instance, \
+                KimaiConnector(kimai_config) as kimai_instance:
+            # Create sync service
+            sync_service = SyncService(
+                zammad_connector=zammad_instance,
+                kimai_connector=kimai_instance,
+                normalizer_service=NormalizerService(),
+                reconciliation_service=ReconciliationService(),
+                db=db
+            )
+            
+            # Sync last 30 days
+            today = date.today()
+            thirty_days_ago = today - timedelta(days=30)
+            stats = await sync_service.sync_time_entries(
+                thirty_days_ago.isoformat(),
+                today.isoformat(),
+                sync_run,
+                trigger_type='scheduled'
+            )
         
-        log.info(f"Scheduled sync #{sync_run.id} completed: {stats}")
+        log.info("Scheduled sync #%s completed: %s", sync_run.id, stats)
         
         # Handle notifications if enabled
         if schedule.notifications:
@@ -141,16 +205,11 @@ async def scheduled_sync_job():
                 # For now, just log it - can be extended with SMTP or webhook calls
         
     except Exception as e:
-        log.error(f"Scheduled sync failed: {e}", exc_info=True)
+        log.error("Scheduled sync failed: %s", e, exc_info=True)
     finally:
         _sync_running = False
+        _release_cluster_lock(cluster_lock)
         db.close()
-        
-        # Process queue if applicable
-        if _sync_queue:
-            _sync_queue.pop(0)
-            log.info("Processing queued sync job")
-            await scheduled_sync_job()
 
 
 def reschedule_sync_job(cron: str, enabled: bool):
@@ -160,7 +219,7 @@ def reschedule_sync_job(cron: str, enabled: bool):
     # Remove existing job if present
     if scheduler.get_job(job_id):
         scheduler.remove_job(job_id)
-        log.info(f"Removed existing job: {job_id}")
+        log.info("Removed existing job: %s", job_id)
     
     # Add new job if enabled
     if enabled:
@@ -172,9 +231,9 @@ def reschedule_sync_job(cron: str, enabled: bool):
                 id=job_id,
                 replace_existing=True
             )
-            log.info(f"Scheduled sync job updated: cron='{cron}'")
+            log.info("Scheduled sync job updated: cron='%s'", cron)
         except Exception as e:
-            log.error(f"Failed to schedule job with cron '{cron}': {e}")
+            log.error("Failed to schedule job with cron '%s': %s", cron, e)
             raise
     else:
         log.info("Scheduled sync job disabled")
@@ -192,11 +251,11 @@ def start_scheduler():
         schedule = db.query(Schedule).first()
         if schedule and schedule.enabled:
             reschedule_sync_job(schedule.cron, True)
-            log.info(f"Loaded schedule from database: cron='{schedule.cron}'")
+            log.info("Loaded schedule from database: cron='%s'", schedule.cron)
         else:
             log.info("No active schedule found in database")
     except Exception as e:
-        log.warning(f"Failed to load initial schedule: {e}")
+        log.warning("Failed to load initial schedule: %s", e)
     finally:
         db.close()
     
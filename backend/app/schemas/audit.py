@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel
 
@@ -28,8 +28,6 @@ class AuditLogInDB(AuditLogBase):
     class Config:
         from_attributes = True
 
-from typing import List
-
 class PaginatedAuditLogs(BaseModel):
     data: List[AuditLogInDB]
     total: int
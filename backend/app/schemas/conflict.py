@@ -1,9 +1,6 @@
 from typing import Optional
 from datetime import datetime, date
-from sqlalchemy.dialects.postgresql import JSONB
 from pydantic import BaseModel, Field, ConfigDict
-from sqlalchemy import Float as SQLFloat
-from typing import Union
 
 class ConflictBase(BaseModel):
     conflict_type: str = Field(..., description="Type of conflict (e.g., 'duplicate', 'mismatch', 'missing')")
@@ -1,8 +1,40 @@
 """Schedule schemas for API requests and responses."""
 
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
 from pydantic import BaseModel, Field, field_validator
 from typing import Literal
 
+try:
+    from croniter import croniter
+except ImportError:
+    # If croniter not installed, cron validation is skipped
+    croniter = None
+
+
+def _validate_cron(v: str) -> str:
+    """Validate cron expression syntax (when croniter is available)."""
+    if croniter is not None and not croniter.is_valid(v):
+        raise ValueError('Invalid cron expression')
+    return v
+
+
+@lru_cache(maxsize=512)
+def _is_valid_timezone(name: str) -> bool:
+    try:
+        ZoneInfo(name)
+    except Exception:
+        return False
+    return True
+
+
+def _validate_timezone(v: str) -> str:
+    """Validate timezone string."""
+    if not _is_valid_timezone(v):
+        raise ValueError(f'Invalid timezone: {v}')
+    return v
+
 
 class ScheduleBase(BaseModel):
     """Base schedule schema."""
@@ -17,25 +49,13 @@ class ScheduleBase(BaseModel):
     @classmethod
     def validate_cron(cls, v: str) -> str:
         """Validate cron expression syntax."""
-        try:
-            from croniter import croniter
-            if not croniter.is_valid(v):
-                raise ValueError('Invalid cron expression')
-        except ImportError:
-            # If croniter not installed, skip validation
-            pass
-        return v
+        return _validate_cron(v)
     
     @field_validator('timezone')
     @classmethod
     def validate_timezone(cls, v: str) -> str:
         """Validate timezone string."""
-        try:
-            from zoneinfo import ZoneInfo
-            ZoneInfo(v)
-        except Exception:
-            raise ValueError(f'Invalid timezone: {v}')
-        return v
+        return _validate_timezone(v)
 
 
 class ScheduleResponse(ScheduleBase):
@@ -65,13 +85,7 @@ class ScheduleUpdate(BaseModel):
         """Validate cron expression syntax if provided."""
         if v is None:
             return v
-        try:
-            from croniter import croniter
-            if not croniter.is_valid(v):
-                raise ValueError('Invalid cron expression')
-        except ImportError:
-            pass
-        return v
+        return _validate_cron(v)
     
     @field_validator('timezone')
     @classmethod
@@ -79,9 +93,4 @@ class ScheduleUpdate(BaseModel):
         """Validate timezone string if provided."""
         if v is None:
             return v
-        try:
-            from zoneinfo import ZoneInfo
-            ZoneInfo(v)
-        except Exception:
-            raise ValueError(f'Invalid timezone: {v}')
-        return v
+        return _validate_timezone(v)
@@ -1,15 +1,18 @@
 """Audit log cleanup service for managing retention policies."""
 
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, case, delete, func, select
 import logging
 
 from app.models.audit_log import AuditLog
+from app.utils.timezone import BRUSSELS_TZ
 
 log = logging.getLogger(__name__)
 
+# Rows deleted per transaction, so locks are released and WAL is flushed between batches
+CLEANUP_BATCH_SIZE = 10000
+
 
 def cleanup_old_access_logs(db: Session, days_to_keep: int = 90) -> int:
     """
@@ -36,21 +39,29 @@ def cleanup_old_access_logs(db: Session, days_to_keep: int = 90) -> int:
             id="audit_cleanup_job"
         )
     """
-    cutoff_date = datetime.now(ZoneInfo('Europe/Brussels')) - timedelta(days=days_to_keep)
+    cutoff_date = datetime.now(BRUSSELS_TZ) - timedelta(days=days_to_keep)
     
     # Define access log actions (everything except sync-related)
     # Sync logs have actions like: sync_triggered, sync_completed, sync_failed
     # Access logs have actions like: login_success, login_failed, connector_created, etc.
     
-    # Delete old access logs (NOT starting with 'sync')
-    deleted = db.query(AuditLog).filter(
+    # Delete old access logs (NOT starting with 'sync') in batches, one commit per batch.
+    # The predicate matches idx_audit_logs_access_created, so each batch is an index range scan.
+    batch_ids = select(AuditLog.id).where(
         and_(
             AuditLog.created_at < cutoff_date,
             ~AuditLog.action.like('sync%')  # Keep all sync-related logs
         )
-    ).delete(synchronize_session=False)
-    
-    db.commit()
+    ).limit(CLEANUP_BATCH_SIZE).scalar_subquery()
+    delete_batch = delete(AuditLog).where(AuditLog.id.in_(batch_ids)).execution_options(synchronize_session=False)
+
+    deleted = 0
+    while True:
+        batch_deleted = db.execute(delete_batch).rowcount
+        db.commit()
+        deleted += batch_deleted
+        if batch_deleted < CLEANUP_BATCH_SIZE:
+            break
     
     log.info(f"Audit cleanup: Deleted {deleted} access log entries older than {days_to_keep} days (cutoff: {cutoff_date.isoformat()})")
     
@@ -64,25 +75,20 @@ def get_audit_log_stats(db: Session) -> dict:
     Returns:
         Dictionary with counts of different log types and oldest entries
     """
-    total_logs = db.query(AuditLog).count()
-    
-    # Count by log type
-    access_logs = db.query(AuditLog).filter(~AuditLog.action.like('sync%')).count()
-    sync_logs = db.query(AuditLog).filter(AuditLog.action.like('sync%')).count()
-    
-    # Oldest entries
-    oldest_access = db.query(AuditLog).filter(
-        ~AuditLog.action.like('sync%')
-    ).order_by(AuditLog.created_at.asc()).first()
-    
-    oldest_sync = db.query(AuditLog).filter(
-        AuditLog.action.like('sync%')
-    ).order_by(AuditLog.created_at.asc()).first()
+    # Counts by log type and oldest entries in a single scan (conditional aggregation)
+    is_sync = AuditLog.action.like('sync%')
+    row = db.query(
+        func.count().label('total'),
+        func.coalesce(func.sum(case((is_sync, 0), else_=1)), 0).label('access'),
+        func.coalesce(func.sum(case((is_sync, 1), else_=0)), 0).label('sync'),
+        func.min(case((is_sync, None), else_=AuditLog.created_at)).label('oldest_access'),
+        func.min(case((is_sync, AuditLog.created_at), else_=None)).label('oldest_sync'),
+    ).one()
     
     return {
-        "total_logs": total_logs,
-        "access_logs": access_logs,
-        "sync_logs": sync_logs,
-        "oldest_access_log": oldest_access.created_at.isoformat() if oldest_access else None,
-        "oldest_sync_log": oldest_sync.created_at.isoformat() if oldest_sync else None
+        "total_logs": row.total,
+        "access_logs": int(row.access),
+        "sync_logs": int(row.sync),
+        "oldest_access_log": row.oldest_access.isoformat() if row.oldest_access else None,
+        "oldest_sync_log": row.oldest_sync.isoformat() if row.oldest_sync else None
     }
@@ -1,12 +1,10 @@
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import time
 import httpx
-from pydantic import BaseModel
 from app.connectors.base import TimeEntryNormalized
 
-class MetadataCacheEntry(BaseModel):
-    name: str
-    timestamp: float
+# Cache entries are (name, expires_at) tuples: expiry is fixed at insert, so a hit is one compare
+MetadataCacheEntry = Tuple[str, float]
 
 class KimaiMetadataService:
     """
@@ -21,7 +19,7 @@ class KimaiMetadataService:
             headers={"Authorization": f"Bearer {token}"},
             timeout=30.0
         )
-        self._caches = {
+        self._caches: Dict[str, Dict[int, MetadataCacheEntry]] = {
             'customers': {},
             'projects': {},
             'activities': {}
@@ -29,51 +27,51 @@ class KimaiMetadataService:
 
     async def get_customer_name(self, customer_id: int) -> Optional[str]:
         """Get customer name by ID, with caching."""
-        cache_key = customer_id
-        if cache_key not in self._caches['customers'] or time.time() - self._caches['customers'][cache_key].timestamp > self.TTL:
-            try:
-                response = await self._client.get(f"/customers/{customer_id}")
-                response.raise_for_status()
-                data = response.json()
-                self._caches['customers'][cache_key] = MetadataCacheEntry(
-                    name=data['name'],
-                    timestamp=time.time()
-                )
-            except httpx.HTTPError:
-                return None
-        return self._caches['customers'].get(cache_key, {}).name
+        cache = self._caches['customers']
+        now = time.time()
+        entry = cache.get(customer_id)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        try:
+            response = await self._client.get(f"/customers/{customer_id}")
+            response.raise_for_status()
+            name = response.json()['name']
+        except httpx.HTTPError:
+            return None
+        cache[customer_id] = (name, now + self.TTL)
+        return name
 
     async def get_project_name(self, project_id: int) -> Optional[str]:
         """Get project name by ID, with caching."""
-        cache_key = project_id
-        if cache_key not in self._caches['projects'] or time.time() - self._caches['projects'][cache_key].timestamp > self.TTL:
-            try:
-                response = await self._client.get(f"/projects/{project_id}")
-                response.raise_for_status()
-                data = response.json()
-                self._caches['projects'][cache_key] = MetadataCacheEntry(
-                    name=data['name'],
-                    timestamp=time.time()
-                )
-            except httpx.HTTPError:
-                return None
-        return self._caches['projects'].get(cache_key, {}).name
+        cache = self._caches['projects']
+        now = time.time()
+        entry = cache.get(project_id)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        try:
+            response = await self._client.get(f"/projects/{project_id}")
+            response.raise_for_status()
+            name = response.json()['name']
+        except httpx.HTTPError:
+            return None
+        cache[project_id] = (name, now + self.TTL)
+        return name
 
     async def get_activity_name(self, activity_id: int) -> Optional[str]:
         """Get activity name by ID, with caching."""
-        cache_key = activity_id
-        if cache_key not in self._caches['activities'] or time.time() - self._caches['activities'][cache_key].timestamp > self.TTL:
-            try:
-                response = await self._client.get(f"/activities/{activity_id}")
-                response.raise_for_status()
-                data = response.json()
-                self._caches['activities'][cache_key] = MetadataCacheEntry(
-                    name=data['name'],
-                    timestamp=time.time()
-                )
-            except httpx.HTTPError:
-                return None
-        return self._caches['activities'].get(cache_key, {}).name
+        cache = self._caches['activities']
+        now = time.time()
+        entry = cache.get(activity_id)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        try:
+            response = await self._client.get(f"/activities/{activity_id}")
+            response.raise_for_status()
+            name = response.json()['name']
+        except httpx.HTTPError:
+            return None
+        cache[activity_id] = (name, now + self.TTL)
+        return name
 
     async def enrich_normalized_entry(self, entry: TimeEntryNormalized) -> TimeEntryNormalized:
         """Enrich a normalized entry with names from IDs."""
@@ -44,7 +44,7 @@ class NormalizerService:
             activity_type_id=zammad_data.get("type_id"),
             activity_name=None,
             user_email="unknown@example.com",
-            entry_date=created_at_dt.strftime("%Y-%m-%d"),
+            entry_date=created_at_dt.date().isoformat(),
             created_at=zammad_data["created_at"],
             updated_at=zammad_data["updated_at"],
             tags=["source:zammad"],
@@ -79,7 +79,7 @@ class NormalizerService:
             activity_type_id=kimai_data["activity"]["id"],
             activity_name=kimai_data["activity"]["name"],
             user_email=kimai_data["user"]["email"],
-            entry_date=begin_datetime.strftime("%Y-%m-%d"),
+            entry_date=begin_datetime.date().isoformat(),
             created_at=kimai_data["createdAt"],
             updated_at=kimai_data["updatedAt"],
             tags=kimai_data.get("tags", []),
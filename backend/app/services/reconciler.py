@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, TYPE_CHECKING
+from typing import Any, List, Dict, Optional, Tuple, TYPE_CHECKING
 from enum import Enum
 from datetime import datetime, date
 
@@ -10,6 +10,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Default for _is_exact_match's `rounded`: None is a valid precomputed value (rounding unavailable)
+_UNSET: Any = object()
+
 class ReconciliationStatus(str, Enum):
     MATCH = "match"
     CONFLICT = "conflict"
@@ -42,13 +45,42 @@ class ReconciliationService:
         """
         self.kimai_connector = kimai_connector
 
-    def _is_exact_match(self, zammad_entry: TimeEntryNormalized, kimai_entry: TimeEntryNormalized) -> bool:
+    def _rounded_zammad_times(self, zammad_entry: TimeEntryNormalized) -> Optional[Tuple[str, int]]:
+        """
+        Applies Kimai's rounding rules to a Zammad entry's begin time and duration.
+
+        Returns (rounded begin as local ISO string, rounded duration in seconds), or None when
+        no KimaiConnector is available, the entry lacks times, or rounding fails.
+        """
+        if not (self.kimai_connector and zammad_entry.begin_time and zammad_entry.entry_date):
+            return None
+        try:
+            z_begin_dt = datetime.fromisoformat(zammad_entry.begin_time)
+            z_date = date.fromisoformat(zammad_entry.entry_date)
+            rounded_begin, rounded_duration = self.kimai_connector.apply_rounding_rules(
+                z_begin_dt,
+                zammad_entry.duration_sec,
+                z_date
+            )
+            return rounded_begin.strftime('%Y-%m-%dT%H:%M:%S'), rounded_duration
+        except Exception as e:
+            log.warning(f"Failed to apply rounding rules for matching: {e}")
+            return None
+
+    def _is_exact_match(
+        self,
+        zammad_entry: TimeEntryNormalized,
+        kimai_entry: TimeEntryNormalized,
+        rounded: Optional[Tuple[str, int]] = _UNSET
+    ) -> bool:
         """
         Checks for an exact match between two normalized time entries.
         Criteria: same source_id (if available from previous sync), or same ticket, date, and time.
         
         When KimaiConnector is available, applies Kimai's rounding rules to Zammad entry
-        before comparison for more accurate matching.
+        before comparison for more accurate matching. Pass the result of
+        _rounded_zammad_times as `rounded` (even when it is None) to avoid recomputing it for
+        every Kimai candidate.
         """
         log.debug(f"Matching check: Zammad {zammad_entry.source_id} (ticket: {zammad_entry.ticket_number}, begin: {zammad_entry.begin_time}, dur: {zammad_entry.duration_sec}) vs Kimai {kimai_entry.source_id} (ticket: {kimai_entry.ticket_number}, begin: {kimai_entry.begin_time}, dur: {kimai_entry.duration_sec})")
         
@@ -58,29 +90,17 @@ class ReconciliationService:
             return True
         
         # Rounding-aware matching (if Kimai connector available)
-        if self.kimai_connector and zammad_entry.begin_time and zammad_entry.entry_date:
-            try:
-                z_begin_dt = datetime.fromisoformat(zammad_entry.begin_time)
-                z_date = date.fromisoformat(zammad_entry.entry_date)
-                
-                # Apply Kimai rounding to Zammad times
-                rounded_begin, rounded_duration = self.kimai_connector.apply_rounding_rules(
-                    z_begin_dt,
-                    zammad_entry.duration_sec,
-                    z_date
-                )
-                
-                rounded_begin_str = rounded_begin.strftime('%Y-%m-%dT%H:%M:%S')
-                
-                # Compare rounded Zammad vs actual Kimai
-                if (zammad_entry.ticket_number == kimai_entry.ticket_number and
-                    rounded_begin_str == kimai_entry.begin_time and
-                    abs(rounded_duration - kimai_entry.duration_sec) <= 60):
-                    log.debug(f" -> Match after applying Kimai rounding rules (rounded begin: {rounded_begin_str}, rounded dur: {rounded_duration}s)")
-                    return True
-            except Exception as e:
-                log.warning(f"Failed to apply rounding rules for matching: {e}")
-                # Continue with non-rounded matching below
+        if rounded is _UNSET:
+            rounded = self._rounded_zammad_times(zammad_entry)
+        if rounded is not None:
+            rounded_begin_str, rounded_duration = rounded
+            # Compare rounded Zammad vs actual Kimai
+            if (zammad_entry.ticket_number == kimai_entry.ticket_number and
+                rounded_begin_str == kimai_entry.begin_time and
+                abs(rounded_duration - kimai_entry.duration_sec) <= 60):
+                log.debug(f" -> Match after applying Kimai rounding rules (rounded begin: {rounded_begin_str}, rounded dur: {rounded_duration}s)")
+                return True
+        # Otherwise continue with non-rounded matching below
         
         # Exact on ticket_number + begin_time + duration (±60s)
         if (zammad_entry.ticket_number == kimai_entry.ticket_number and
@@ -136,10 +156,24 @@ class ReconciliationService:
         reconciled_results: List[ReconciledTimeEntry] = []
         unmatched_kimai_entries = {entry.source_id: entry for entry in kimai_entries}
 
+        # Every match/conflict rule except the source_id one requires equal ticket numbers, so each
+        # Zammad entry only needs to be compared with its source_id twin and its ticket's bucket
+        # (not every unmatched Kimai entry). Candidates are still tried in Kimai order.
+        kimai_order = {k_id: index for index, k_id in enumerate(unmatched_kimai_entries)}
+        unmatched_by_ticket: Dict[Optional[str], Dict[str, TimeEntryNormalized]] = {}
+        for k_id, k_entry in unmatched_kimai_entries.items():
+            unmatched_by_ticket.setdefault(k_entry.ticket_number, {})[k_id] = k_entry
+
         for z_entry in zammad_entries:
             found_match = False
-            for k_id, k_entry in list(unmatched_kimai_entries.items()): # Iterate over copy to allow deletion
-                if self._is_exact_match(z_entry, k_entry):
+            candidates = dict(unmatched_by_ticket.get(z_entry.ticket_number, {}))
+            if z_entry.source_id and z_entry.source_id in unmatched_kimai_entries and z_entry.source_id not in candidates:
+                candidates[z_entry.source_id] = unmatched_kimai_entries[z_entry.source_id]
+                candidates = dict(sorted(candidates.items(), key=lambda item: kimai_order[item[0]]))
+            # Rounded Zammad times are the same for every candidate; compute them once
+            rounded = self._rounded_zammad_times(z_entry) if candidates else None
+            for k_id, k_entry in candidates.items():
+                if self._is_exact_match(z_entry, k_entry, rounded):
                     reconciled_results.append(ReconciledTimeEntry(
                         **z_entry.model_dump(),
                         reconciliation_status=ReconciliationStatus.MATCH,
@@ -147,6 +181,7 @@ class ReconciliationService:
                         zammad_entry=z_entry
                     ))
                     del unmatched_kimai_entries[k_id]
+                    del unmatched_by_ticket[k_entry.ticket_number][k_id]
                     found_match = True
                     break
                 elif self._is_conflict(z_entry, k_entry):
@@ -157,6 +192,7 @@ class ReconciliationService:
                         zammad_entry=z_entry
                     ))
                     del unmatched_kimai_entries[k_id]
+                    del unmatched_by_ticket[k_entry.ticket_number][k_id]
                     found_match = True
                     break
                 # Log potential near-misses for debugging
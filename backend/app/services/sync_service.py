@@ -1,6 +1,5 @@
 from typing import List, Dict, Any
 from datetime import datetime, timedelta, date
-from zoneinfo import ZoneInfo
 
 from sqlalchemy.orm import Session
 
@@ -18,8 +17,9 @@ from app.models.sync_run import SyncRun
 from app.models.time_entry import TimeEntry
 from app.models.connector import Connector as DBConnector
 from app.constants.conflict_reasons import ReasonCode, explain_reason
-from sqlalchemy import or_, and_
+from sqlalchemy import or_, and_, insert
 from app.schemas.connector import KimaiConnectorConfig
+from app.utils.timezone import BRUSSELS_TZ
 from typing import Dict, Any
 import traceback
 
@@ -185,6 +185,65 @@ Zammad URL: {zammad_url}
             log.error(f"Failed to create timesheet for {entry.source_id}: {e}")
             return {'status': 'error', 'error': str(e)}
 
+    # Rows per IN-lookup / multi-row INSERT when persisting pending Zammad entries
+    PERSIST_BATCH_SIZE = 500
+
+    def _persist_pending_entries(self, entries: List[TimeEntryNormalized], connector_id: int) -> Dict[str, int]:
+        """
+        Persists Zammad entries as pending TimeEntry rows, leaving already-known ones untouched.
+
+        Existing rows are looked up and new rows inserted in batches instead of one query
+        (plus flush) per entry. Returns a map of Zammad source_id -> TimeEntry ID.
+        """
+        # First occurrence wins for duplicate source_ids within one fetch
+        entries_by_source_id: Dict[str, TimeEntryNormalized] = {}
+        for entry in entries:
+            entries_by_source_id.setdefault(entry.source_id, entry)
+        source_ids = list(entries_by_source_id)
+        source_id_to_te: Dict[str, int] = {}
+
+        for i in range(0, len(source_ids), self.PERSIST_BATCH_SIZE):
+            batch = source_ids[i:i + self.PERSIST_BATCH_SIZE]
+            existing = self.db.query(TimeEntry.source_id, TimeEntry.id).filter(
+                TimeEntry.source == 'zammad',
+                TimeEntry.source_id.in_(batch)
+            ).all()
+            source_id_to_te.update(existing)
+        if source_id_to_te:
+            log.debug("%d Zammad entries already have a TimeEntry, skipping insert", len(source_id_to_te))
+
+        now = datetime.now(BRUSSELS_TZ)
+        new_rows = [
+            {
+                "connector_id": connector_id,
+                "source": 'zammad',
+                "source_id": entry.source_id,
+                "ticket_number": entry.ticket_number,
+                "ticket_id": entry.ticket_id,
+                "description": entry.description,
+                "time_minutes": entry.duration_sec / 60.0,
+                "activity_type_id": entry.activity_type_id,
+                "activity_name": entry.activity_name,
+                "user_email": entry.user_email,
+                "entry_date": date.fromisoformat(entry.entry_date),
+                "sync_status": 'pending',
+                "created_at": now,
+                "updated_at": now,
+            }
+            for source_id, entry in entries_by_source_id.items()
+            if source_id not in source_id_to_te
+        ]
+        for i in range(0, len(new_rows), self.PERSIST_BATCH_SIZE):
+            inserted = self.db.execute(
+                insert(TimeEntry).returning(TimeEntry.source_id, TimeEntry.id),
+                new_rows[i:i + self.PERSIST_BATCH_SIZE]
+            ).all()
+            source_id_to_te.update(inserted)
+        if new_rows:
+            log.debug("Created %d pending TimeEntry rows for Zammad entries", len(new_rows))
+
+        return source_id_to_te
+
     async def sync_time_entries(self, start_date: str, end_date: str, sync_run: SyncRun, trigger_type: str = 'manual') -> dict:
         """
         Performs a full synchronization cycle for time entries within the given date range.
@@ -217,40 +276,8 @@ Zammad URL: {zammad_url}
                 raise ValueError("No active Zammad connector found")
             zammad_connector_id = zammad_conn_db.id
 
-            # Persist Zammad entries as pending TimeEntry records
-            source_id_to_te = {}  # source_id -> TimeEntry ID
-            for entry in zammad_normalized_entries:
-                # Check if already exists (idempotency)
-                existing_te = self.db.query(TimeEntry).filter(
-                    TimeEntry.source == 'zammad',
-                    TimeEntry.source_id == entry.source_id
-                ).first()
-                if existing_te:
-                    log.debug(f"TimeEntry already exists for Zammad {entry.source_id}, skipping insert")
-                    source_id_to_te[entry.source_id] = existing_te.id
-                    continue
-
-                te = TimeEntry(
-                    connector_id=zammad_connector_id,
-                    source='zammad',
-                    source_id=entry.source_id,
-                    ticket_number=entry.ticket_number,
-                    ticket_id=entry.ticket_id,
-                    description=entry.description,
-                    time_minutes=entry.duration_sec / 60.0,
-                    activity_type_id=entry.activity_type_id,
-                    activity_name=entry.activity_name,
-                    user_email=entry.user_email,
-                    entry_date=date.fromisoformat(entry.entry_date),
-                    sync_status='pending',
-                    created_at=datetime.now(ZoneInfo('Europe/Brussels')),
-                    updated_at=datetime.now(ZoneInfo('Europe/Brussels'))
-                )
-                self.db.add(te)
-                self.db.flush()  # Flush to get ID without commit
-                source_id_to_te[entry.source_id] = te.id
-                log.debug(f"Created pending TimeEntry ID {te.id} for Zammad {entry.source_id}")
-
+            # Persist Zammad entries as pending TimeEntry records (idempotent: existing ones are kept)
+            source_id_to_te = self._persist_pending_entries(zammad_normalized_entries, zammad_connector_id)
             self.db.commit()  # Commit pending inserts
 
             # 2. Fetch existing entries from Kimai
@@ -289,7 +316,7 @@ Zammad URL: {zammad_url}
                     # Ensure synced status
                     if te.sync_status != 'synced':
                         te.sync_status = 'synced'
-                        te.updated_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                        te.updated_at = datetime.now(BRUSSELS_TZ)
                         self.db.commit()
                         log.debug(f"Updated TimeEntry {te_id} to 'synced' for match")
                 elif rec.reconciliation_status == ReconciliationStatus.MISSING_IN_KIMAI:
@@ -308,7 +335,7 @@ Zammad URL: {zammad_url}
                             log.warning(f"Ignoring unmapped activity for Zammad entry {z_entry.source_id} (type_id: {z_entry.activity_type_id})")
                             te.sync_status = 'error'
                             te.sync_error = 'Unmapped activity (ignored)'
-                            te.updated_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                            te.updated_at = datetime.now(BRUSSELS_TZ)
                             self.db.commit()
                             stats["ignored_unmapped"] += 1
                             continue  # Skip creation without conflict
@@ -338,7 +365,7 @@ Zammad URL: {zammad_url}
                         log.info(f"Duplicate unmapped conflict skipped for ticket {z_entry.ticket_number}, activity {z_entry.activity_name}")
                         te.sync_status = 'conflict'
                         te.sync_error = detail
-                        te.updated_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                        te.updated_at = datetime.now(BRUSSELS_TZ)
                         self.db.commit()
                         stats["skipped_duplicates"] += 1
                         continue
@@ -363,7 +390,7 @@ Zammad URL: {zammad_url}
                     self.db.commit()
                     te.sync_status = 'conflict'
                     te.sync_error = detail
-                    te.updated_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                    te.updated_at = datetime.now(BRUSSELS_TZ)
                     self.db.commit()
                     stats["unmapped"] += 1
                     stats["conflicts"] += 1
@@ -374,9 +401,9 @@ Zammad URL: {zammad_url}
                     if timesheet['status'] == 'created':
                         # Update TimeEntry to synced
                         te.kimai_id = timesheet['id']
-                        te.synced_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                        te.synced_at = datetime.now(BRUSSELS_TZ)
                         te.sync_status = 'synced'
-                        te.updated_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                        te.updated_at = datetime.now(BRUSSELS_TZ)
                         self.db.commit()
                         stats["created"] += 1
                         log.info(f"Updated TimeEntry {te_id} to 'synced' with Kimai ID {timesheet['id']}")
@@ -400,7 +427,7 @@ Zammad URL: {zammad_url}
                             log.info(f"Duplicate creation error conflict skipped for ticket {z_entry.ticket_number}")
                             te.sync_status = 'error'
                             te.sync_error = detail
-                            te.updated_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                            te.updated_at = datetime.now(BRUSSELS_TZ)
                             self.db.commit()
                             stats["skipped_duplicates"] += 1
                         else:
@@ -424,7 +451,7 @@ Zammad URL: {zammad_url}
                             self.db.commit()
                             te.sync_status = 'error'
                             te.sync_error = detail
-                            te.updated_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                            te.updated_at = datetime.now(BRUSSELS_TZ)
                             self.db.commit()
                             stats["conflicts"] += 1
                 elif rec.reconciliation_status == ReconciliationStatus.CONFLICT:
@@ -464,7 +491,7 @@ Zammad URL: {zammad_url}
                         log.info(f"Duplicate conflict skipped for ticket {z_entry.ticket_number}")
                         te.sync_status = 'conflict'
                         te.sync_error = detail
-                        te.updated_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                        te.updated_at = datetime.now(BRUSSELS_TZ)
                         self.db.commit()
                         stats["skipped_duplicates"] += 1
                     else:
@@ -493,18 +520,18 @@ Zammad URL: {zammad_url}
                         self.db.commit()
                         te.sync_status = 'conflict'
                         te.sync_error = detail
-                        te.updated_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                        te.updated_at = datetime.now(BRUSSELS_TZ)
                         self.db.commit()
                         stats["conflicts"] += 1
                 else:
                     stats["skipped"] += 1
                     if te:
                         te.sync_status = 'skipped'
-                        te.updated_at = datetime.now(ZoneInfo('Europe/Brussels'))
+                        te.updated_at = datetime.now(BRUSSELS_TZ)
                         self.db.commit()
 
             # Update SyncRun on success
-            sync_run.end_time = datetime.now(ZoneInfo('Europe/Brussels'))
+            sync_run.end_time = datetime.now(BRUSSELS_TZ)
             sync_run.status = 'completed'
             sync_run.entries_synced = stats["created"]
             sync_run.entries_already_synced = stats["reconciled_matches"]
@@ -538,7 +565,7 @@ Zammad URL: {zammad_url}
                 stats["error"] = error_type
             
             # Update SyncRun on failure
-            sync_run.end_time = datetime.now(ZoneInfo('Europe/Brussels'))
+            sync_run.end_time = datetime.now(BRUSSELS_TZ)
             sync_run.status = 'failed'
             sync_run.error_message = error_type
             sync_run.entries_synced = stats["created"]
@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from cryptography.fernet import Fernet
 from app.config import settings
 
+@lru_cache(maxsize=1)
 def get_fernet_key():
     """Returns the Fernet key from settings."""
     return Fernet(settings.encryption_key.encode('utf-8'))
@@ -10,7 +13,8 @@ def encrypt_data(data: str) -> str:
     f = get_fernet_key()
     return f.encrypt(data.encode('utf-8')).decode('utf-8')
 
+@lru_cache(maxsize=32)
 def decrypt_data(encrypted_data: str) -> str:
-    """Decrypts a string using Fernet."""
+    """Decrypts a string using Fernet (cached per ciphertext; a rotated token has a new ciphertext)."""
     f = get_fernet_key()
     return f.decrypt(encrypted_data.encode('utf-8')).decode('utf-8')
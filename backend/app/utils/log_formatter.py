@@ -0,0 +1,25 @@
+"""JSON log formatter for structured log ingestion."""
+
+import logging
+
+import orjson
+
+
+class JsonLogFormatter(logging.Formatter):
+    """
+    Formats each log record as one JSON object per line.
+
+    Uses the record's epoch timestamp as-is instead of rendering it with strftime,
+    which keeps formatting cheap when the connectors log at TRACE/VERBOSE level.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "t": record.created,
+            "lvl": record.levelname,
+            "lg": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
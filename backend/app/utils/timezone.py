@@ -0,0 +1,7 @@
+"""Local timezone used for timestamps written by the application."""
+
+from zoneinfo import ZoneInfo
+
+# Resolved once: ZoneInfo construction parses the tz database entry
+BRUSSELS_TIMEZONE = "Europe/Brussels"
+BRUSSELS_TZ = ZoneInfo(BRUSSELS_TIMEZONE)
@@ -0,0 +1,112 @@
+import pytest
+
+from app.connectors.base import TimeEntryNormalized
+from app.services.reconciler import ReconciliationService, ReconciliationStatus
+
+
+def make_entry(source, source_id, ticket_number, duration_sec=900, begin_time="2024-01-10T09:00:00"):
+    return TimeEntryNormalized(
+        source_id=source_id,
+        source=source,
+        description="Work",
+        duration_sec=duration_sec,
+        entry_date=begin_time[:10],
+        begin_time=begin_time,
+        end_time=begin_time,
+        user_email="agent@example.com",
+        ticket_number=ticket_number,
+        created_at="2024-01-10T09:00:00Z",
+        updated_at="2024-01-10T09:00:00Z",
+    )
+
+
+@pytest.mark.asyncio
+async def test_reconcile_matches_within_ticket_and_reports_missing():
+    zammad_entries = [
+        make_entry("zammad", "z1", "1001"),
+        make_entry("zammad", "z2", "1002", duration_sec=1800),
+        make_entry("zammad", "z3", "1003"),
+    ]
+    kimai_entries = [
+        make_entry("kimai", "k1", "1002", duration_sec=900),
+        make_entry("kimai", "k2", "1001"),
+        make_entry("kimai", "k3", "2000"),
+    ]
+
+    results = await ReconciliationService().reconcile_entries(zammad_entries, kimai_entries)
+
+    by_status = [
+        (r.reconciliation_status, r.zammad_entry and r.zammad_entry.source_id, r.kimai_entry and r.kimai_entry.source_id)
+        for r in results
+    ]
+    assert by_status == [
+        (ReconciliationStatus.MATCH, "z1", "k2"),
+        (ReconciliationStatus.CONFLICT, "z2", "k1"),
+        (ReconciliationStatus.MISSING_IN_KIMAI, "z3", None),
+        (ReconciliationStatus.MISSING_IN_ZAMMAD, None, "k3"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reconcile_uses_each_kimai_entry_once():
+    zammad_entries = [make_entry("zammad", "z1", "1001"), make_entry("zammad", "z2", "1001")]
+    kimai_entries = [make_entry("kimai", "k1", "1001")]
+
+    results = await ReconciliationService().reconcile_entries(zammad_entries, kimai_entries)
+
+    assert [r.reconciliation_status for r in results] == [
+        ReconciliationStatus.MATCH,
+        ReconciliationStatus.MISSING_IN_KIMAI,
+    ]
+
+
+class CountingRoundingConnector:
+    def __init__(self):
+        self.calls = 0
+
+    def apply_rounding_rules(self, begin, duration_sec, entry_date):
+        self.calls += 1
+        return begin.replace(minute=0), duration_sec
+
+
+@pytest.mark.asyncio
+async def test_reconcile_rounds_each_zammad_entry_once():
+    connector = CountingRoundingConnector()
+    zammad_entries = [make_entry("zammad", "z1", "1001", begin_time="2024-01-10T09:07:00")]
+    kimai_entries = [
+        make_entry("kimai", "k1", "1001", begin_time="2024-01-08T09:00:00"),
+        make_entry("kimai", "k2", "1001", begin_time="2024-01-09T09:00:00"),
+        make_entry("kimai", "k3", "1001", begin_time="2024-01-10T09:00:00"),
+    ]
+
+    results = await ReconciliationService(kimai_connector=connector).reconcile_entries(zammad_entries, kimai_entries)
+
+    assert connector.calls == 1
+    assert results[0].reconciliation_status == ReconciliationStatus.MATCH
+    assert results[0].kimai_entry.source_id == "k3"
+
+
+class FailingRoundingConnector:
+    def __init__(self):
+        self.calls = 0
+
+    def apply_rounding_rules(self, begin, duration_sec, entry_date):
+        self.calls += 1
+        raise ValueError("no rounding rules")
+
+
+@pytest.mark.asyncio
+async def test_reconcile_does_not_retry_failed_rounding_per_candidate():
+    connector = FailingRoundingConnector()
+    zammad_entries = [make_entry("zammad", "z1", "1001")]
+    kimai_entries = [
+        make_entry("kimai", "k1", "1001", begin_time="2024-01-08T09:00:00"),
+        make_entry("kimai", "k2", "1001", begin_time="2024-01-09T09:00:00"),
+        make_entry("kimai", "k3", "1001"),
+    ]
+
+    results = await ReconciliationService(kimai_connector=connector).reconcile_entries(zammad_entries, kimai_entries)
+
+    assert connector.calls == 1
+    assert results[0].reconciliation_status == ReconciliationStatus.MATCH
+    assert results[0].kimai_entry.source_id == "k3"
@@ -0,0 +1,367 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from app.connectors.zammad_connector import (
+    ZammadConnector,
+    _minutes_to_seconds,
+    _to_local_html5,
+    close_shared_clients,
+    get_shared_client,
+)
+
+BASE_URL = "https://zammad.example.com"
+
+
+@pytest_asyncio.fixture
+async def connector():
+    ZammadConnector._metadata_cache.clear()
+    ZammadConnector._bulk_accounting_unsupported.clear()
+    connector = ZammadConnector({"base_url": BASE_URL, "api_token": "fake-token"})
+    yield connector
+    await connector.aclose()
+
+
+@pytest.mark.asyncio
+async def test_validate_connection_success(connector, httpx_mock):
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/users/me", json={"id": 1})
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/time_accounting/types",
+        json=[{"id": 1, "name": "Support", "active": True}]
+    )
+
+    assert await connector.validate_connection() is True
+
+
+@pytest.mark.asyncio
+async def test_validate_connection_no_activities_raises(connector, httpx_mock):
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/users/me", json={"id": 1})
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/time_accounting/types", json=[])
+
+    with pytest.raises(ValueError):
+        await connector.validate_connection()
+
+
+@pytest.mark.asyncio
+async def test_validate_connection_unauthorized_returns_false(connector, httpx_mock):
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/users/me", status_code=500)
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/time_accounting/types",
+        json=[{"id": 1, "name": "Support"}]
+    )
+
+    assert await connector.validate_connection() is False
+
+
+@pytest.mark.asyncio
+async def test_fetch_activities_is_cached(connector, httpx_mock):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/time_accounting/types",
+        json=[{"id": 1, "name": "Support"}, {"id": 2, "name": "Old", "active": False}]
+    )
+
+    first = await connector.fetch_activities()
+    second = await connector.fetch_activities()
+
+    assert first == [{"id": 1, "name": "Support"}]
+    assert second == first
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def add_lookup_responses(httpx_mock, bulk_accountings=None):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/time_accounting/types",
+        json=[{"id": 3, "name": "Remote Support"}]
+    )
+    if bulk_accountings is not None:
+        httpx_mock.add_response(
+            url=(
+                f"{BASE_URL}/api/v1/time_accountings/search"
+                "?query=created_at%3A%5B2024-01-01+TO+2024-01-31%5D&page=1&per_page=200"
+            ),
+            json=bulk_accountings
+        )
+
+
+@pytest.mark.asyncio
+async def test_fetch_time_entries_preserves_ticket_order(connector, httpx_mock):
+    add_lookup_responses(httpx_mock)
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/tickets/search?query=updated_at%3A%5B2024-01-01+TO+2024-01-31%5D&page=1&per_page=200",
+        json=[{"id": 1, "number": "1001"}, {"id": 2, "number": "1002"}]
+    )
+    for ticket_id, accounting_id in ((1, 11), (2, 22)):
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/api/v1/tickets/{ticket_id}/time_accountings",
+            json=[{"id": accounting_id, "time_unit": "15", "created_at": "2024-01-10T09:00:00Z"}]
+        )
+
+    entries = await connector.fetch_time_entries("2024-01-01", "2024-01-31")
+
+    assert [entry.source_id for entry in entries] == ["11", "22"]
+    assert all(entry.duration_sec == 900 for entry in entries)
+
+
+@pytest.mark.asyncio
+async def test_fetch_time_entries_fetches_each_org_once(connector, httpx_mock):
+    add_lookup_responses(httpx_mock)
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/tickets/search?query=updated_at%3A%5B2024-01-01+TO+2024-01-31%5D&page=1&per_page=200",
+        json=[
+            {"id": 1, "number": "1001", "organization_id": 5},
+            {"id": 2, "number": "1002", "organization_id": 5}
+        ]
+    )
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/organizations/5", json={"id": 5, "name": "Acme"})
+    for ticket_id in (1, 2):
+        httpx_mock.add_response(
+            url=f"{BASE_URL}/api/v1/tickets/{ticket_id}/time_accountings",
+            json=[{"id": ticket_id * 10, "time_unit": "30", "created_at": "2024-01-10T09:00:00Z"}]
+        )
+
+    entries = await connector.fetch_time_entries("2024-01-01", "2024-01-31")
+
+    assert [entry.org_name for entry in entries] == ["Acme", "Acme"]
+    org_requests = [r for r in httpx_mock.get_requests() if r.url.path == "/api/v1/organizations/5"]
+    assert len(org_requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_time_entries_falls_back_to_customer_org_when_ticket_org_missing(connector, httpx_mock):
+    add_lookup_responses(httpx_mock)
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/tickets/search?query=updated_at%3A%5B2024-01-01+TO+2024-01-31%5D&page=1&per_page=200",
+        json=[{"id": 1, "number": "1001", "organization_id": 5, "customer_id": 9}]
+    )
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/organizations/5", status_code=404)
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/users/9",
+        json={"id": 9, "email": "customer@example.com", "organization_id": 6}
+    )
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/organizations/6", json={"id": 6, "name": "Globex"})
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/tickets/1/time_accountings",
+        json=[{"id": 11, "time_unit": "15", "created_at": "2024-01-10T09:00:00Z"}]
+    )
+
+    entries = await connector.fetch_time_entries("2024-01-01", "2024-01-31")
+
+    assert [entry.org_name for entry in entries] == ["Globex"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_organization_cache_shared_across_instances(connector, httpx_mock):
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/organizations/5", json={"id": 5, "name": "Acme"})
+
+    await connector.fetch_organization(5)
+    async with ZammadConnector({"base_url": BASE_URL, "api_token": "fake-token"}) as other:
+        org = await other.fetch_organization(5)
+
+    assert org == {"id": 5, "name": "Acme"}
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_organization_cache_is_scoped_to_api_token(connector, httpx_mock):
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/organizations/5", json={"id": 5, "name": "Acme"})
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/organizations/5", json={"id": 5, "name": "Acme"})
+
+    await connector.fetch_organization(5)
+    async with ZammadConnector({"base_url": BASE_URL, "api_token": "other-token"}) as other:
+        await other.fetch_organization(5)
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_time_entries_skips_tickets_without_accounted_time(connector, httpx_mock):
+    add_lookup_responses(httpx_mock)
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/tickets/search?query=updated_at%3A%5B2024-01-01+TO+2024-01-31%5D&page=1&per_page=200",
+        json=[{"id": 1, "number": "1001", "time_unit": None}, {"id": 2, "number": "1002", "time_unit": "15.0"}]
+    )
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/tickets/2/time_accountings",
+        json=[{"id": 22, "time_unit": "15", "created_at": "2024-01-10T09:00:00Z"}]
+    )
+
+    entries = await connector.fetch_time_entries("2024-01-01", "2024-01-31")
+
+    assert [entry.source_id for entry in entries] == ["22"]
+    assert not any(request.url.path == "/api/v1/tickets/1/time_accountings" for request in httpx_mock.get_requests())
+
+
+@pytest.mark.asyncio
+async def test_fetch_tickets_by_date_resolves_assets(connector, httpx_mock):
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/tickets/search?query=updated_at%3A%5B2024-01-01+TO+2024-01-31%5D&page=1&per_page=200",
+        json={
+            "tickets": [2, 1],
+            "tickets_count": 2,
+            "assets": {"Ticket": {"1": {"id": 1, "number": "1001"}, "2": {"id": 2, "number": "1002"}}}
+        }
+    )
+
+    tickets = await connector.fetch_tickets_by_date("2024-01-01", "2024-01-31")
+
+    assert [ticket["number"] for ticket in tickets] == ["1002", "1001"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_tickets_by_date_paginates(connector, httpx_mock):
+    connector.TICKET_SEARCH_PAGE_SIZE = 2
+    connector.ticket_concurrency = 2
+    search_url = f"{BASE_URL}/api/v1/tickets/search?query=updated_at%3A%5B2024-01-01+TO+2024-01-31%5D"
+    httpx_mock.add_response(url=f"{search_url}&page=1&per_page=2", json=[{"id": 1}, {"id": 2}])
+    httpx_mock.add_response(url=f"{search_url}&page=2&per_page=2", json=[{"id": 2}, {"id": 3}])
+    httpx_mock.add_response(url=f"{search_url}&page=3&per_page=2", json=[])
+
+    tickets = await connector.fetch_tickets_by_date("2024-01-01", "2024-01-31")
+
+    assert [ticket["id"] for ticket in tickets] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_fetch_time_entries_resolves_activity_names(connector, httpx_mock):
+    add_lookup_responses(httpx_mock)
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/tickets/search?query=updated_at%3A%5B2024-01-01+TO+2024-01-31%5D&page=1&per_page=200",
+        json=[{"id": 1, "number": "1001"}]
+    )
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/tickets/1/time_accountings",
+        json=[{"id": 11, "time_unit": "15", "type_id": 3, "created_at": "2024-01-10T09:00:00Z"}]
+    )
+
+    entries = await connector.fetch_time_entries("2024-01-01", "2024-01-31")
+
+    assert entries[0].activity_name == "Remote Support"
+
+
+@pytest.mark.asyncio
+async def test_injected_client_is_not_closed_by_connector():
+    client = get_shared_client(BASE_URL, "fake-token")
+    async with ZammadConnector({"base_url": BASE_URL, "api_token": "fake-token"}, client=client):
+        pass
+
+    assert not client.is_closed
+    assert get_shared_client(BASE_URL, "fake-token") is client
+    await close_shared_clients()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_fetch_time_entries_uses_bulk_time_accountings(connector, httpx_mock):
+    connector.bulk_time_accountings = True
+    add_lookup_responses(httpx_mock, bulk_accountings=[
+        {"id": 22, "ticket_id": 2, "time_unit": "15", "created_at": "2024-01-10T09:00:00Z"},
+        {"id": 11, "ticket_id": 1, "time_unit": "30", "created_at": "2024-01-11T09:00:00Z"},
+        {"id": 33, "ticket_id": 1, "time_unit": "30", "created_at": "2023-12-31T09:00:00Z"}
+    ])
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/tickets/search?query=updated_at%3A%5B2024-01-01+TO+2024-01-31%5D&page=1&per_page=200",
+        json=[{"id": 1, "number": "1001"}, {"id": 2, "number": "1002"}]
+    )
+
+    entries = await connector.fetch_time_entries("2024-01-01", "2024-01-31")
+
+    assert [entry.source_id for entry in entries] == ["11", "22"]
+    assert not any("/time_accountings" in request.url.path and "/tickets/" in request.url.path
+                   for request in httpx_mock.get_requests())
+
+
+@pytest.mark.asyncio
+async def test_fetch_time_entries_prefetches_agents_once(connector, httpx_mock):
+    connector.bulk_time_accountings = True
+    add_lookup_responses(httpx_mock, bulk_accountings=[
+        {"id": 11, "ticket_id": 1, "time_unit": "15", "created_by_id": 7, "created_at": "2024-01-10T09:00:00Z"},
+        {"id": 22, "ticket_id": 2, "time_unit": "15", "created_by_id": 7, "created_at": "2024-01-10T10:00:00Z"},
+        # Ticket 3 isn't in the ticket search results: its creator must not be fetched
+        {"id": 33, "ticket_id": 3, "time_unit": "15", "created_by_id": 8, "created_at": "2024-01-10T11:00:00Z"}
+    ])
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/tickets/search?query=updated_at%3A%5B2024-01-01+TO+2024-01-31%5D&page=1&per_page=200",
+        json=[{"id": 1, "number": "1001"}, {"id": 2, "number": "1002"}]
+    )
+    httpx_mock.add_response(
+        url=f"{BASE_URL}/api/v1/users/7",
+        json={"id": 7, "firstname": "Ada", "lastname": "Agent", "email": "ada@example.com"}
+    )
+
+    entries = await connector.fetch_time_entries("2024-01-01", "2024-01-31")
+
+    assert [entry.user_email for entry in entries] == ["ada@example.com", "ada@example.com"]
+    assert len([r for r in httpx_mock.get_requests() if r.url.path == "/api/v1/users/7"]) == 1
+    assert not any(r.url.path == "/api/v1/users/8" for r in httpx_mock.get_requests())
+
+
+def test_to_local_html5_converts_to_brussels_time():
+    assert _to_local_html5("2024-07-10T09:00:00.123Z") == "2024-07-10T11:00:00"
+    assert _to_local_html5("2024-01-10T09:00:00+00:00") == "2024-01-10T10:00:00"
+
+
+def test_minutes_to_seconds_accepts_numbers_and_strings():
+    assert _minutes_to_seconds(15) == 900
+    assert _minutes_to_seconds("15.0") == 900
+    assert _minutes_to_seconds(1.15) == 69
+    assert _minutes_to_seconds(None) == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_tickets_by_date_pages_past_tickets_count(connector, httpx_mock):
+    connector.TICKET_SEARCH_PAGE_SIZE = 2
+    connector.ticket_concurrency = 2
+    search_url = f"{BASE_URL}/api/v1/tickets/search?query=updated_at%3A%5B2024-01-01+TO+2024-01-31%5D"
+    for page, ids in ((1, [1, 2]), (2, [3, 4]), (3, [5])):
+        httpx_mock.add_response(
+            url=f"{search_url}&page={page}&per_page=2",
+            json={
+                "tickets": ids,
+                "tickets_count": len(ids),  # Zammad reports the page length, not the total
+                "assets": {"Ticket": {str(i): {"id": i} for i in ids}}
+            }
+        )
+
+    tickets = await connector.fetch_tickets_by_date("2024-01-01", "2024-01-31")
+
+    assert [ticket["id"] for ticket in tickets] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_fetch_tickets_by_date_stops_at_window_with_short_page(connector, httpx_mock):
+    connector.TICKET_SEARCH_PAGE_SIZE = 2
+    connector.ticket_concurrency = 2
+    search_url = f"{BASE_URL}/api/v1/tickets/search?query=updated_at%3A%5B2024-01-01+TO+2024-01-31%5D"
+    for page, ids in ((1, [1, 2]), (2, [3, 4]), (3, [5, 6]), (4, [7]), (5, [])):
+        httpx_mock.add_response(
+            url=f"{search_url}&page={page}&per_page=2",
+            json={"tickets": ids, "tickets_count": len(ids), "assets": {"Ticket": {str(i): {"id": i} for i in ids}}}
+        )
+
+    tickets = await connector.fetch_tickets_by_date("2024-01-01", "2024-01-31")
+
+    assert [ticket["id"] for ticket in tickets] == [1, 2, 3, 4, 5, 6, 7]
+    assert sorted(int(request.url.params["page"]) for request in httpx_mock.get_requests()) == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_organization_fetches_share_one_request(connector, httpx_mock):
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/organizations/5", json={"id": 5, "name": "Acme"})
+
+    orgs = await asyncio.gather(*(connector.fetch_organization(5) for _ in range(3)))
+
+    assert orgs == [{"id": 5, "name": "Acme"}] * 3
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_user_cache_shared_across_instances(connector, httpx_mock):
+    httpx_mock.add_response(url=f"{BASE_URL}/api/v1/users/7", json={"id": 7, "email": "ada@example.com"})
+
+    await connector._fetch_user(7)
+    async with ZammadConnector({"base_url": BASE_URL, "api_token": "fake-token"}) as other:
+        user = await other._fetch_user(7)
+
+    assert user == {"id": 7, "email": "ada@example.com"}
+    assert len(httpx_mock.get_requests()) == 1